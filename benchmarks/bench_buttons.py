@@ -0,0 +1,123 @@
+"""Micro-benchmark for AXISMouseController press/release latency
+
+Compares the current controller (precompiled alias tables, per-name
+resolution cache) with a replica of the previous implementation that
+rebuilt both lookup dicts on every press and release. A no-op backend
+stands in for pynput so only the Python-side dispatch cost is measured.
+
+    python benchmarks/bench_buttons.py
+    python benchmarks/bench_buttons.py --save buttons.json
+"""
+import argparse
+import sys
+
+from harness import add_result_args, finish, measure
+
+import client
+
+
+class FakeButton:
+    left = "Button.left"
+    right = "Button.right"
+    middle = "Button.middle"
+    x1 = "Button.x1"
+    x2 = "Button.x2"
+
+
+class NullBackend:
+    def press(self, button):
+        pass
+
+    def release(self, button):
+        pass
+
+
+def _attach_fake_backend(controller):
+    controller.controller = NullBackend()
+    controller.button_class = FakeButton
+    controller.pynput_available = True
+    controller.buttons = controller._build_button_table()
+    controller._resolved.clear()
+    return controller
+
+
+class LegacyMouseController(client.AXISMouseController):
+    """Previous behaviour: both alias dicts are rebuilt on every call"""
+
+    def __init__(self):
+        super().__init__()
+        self.states = {}
+
+    def normalize_button_name(self, button_name):
+        if not button_name:
+            return ""
+        name = button_name.lower().strip().replace(' ', '').replace('_', '').replace('-', '')
+        button_map = dict(client.MOUSE_BUTTON_ALIASES)
+        return button_map.get(name, "")
+
+    def get_button(self, button_name):
+        if not self.button_class:
+            return None
+        normalized = self.normalize_button_name(button_name)
+        button_map = {
+            'left': self.button_class.left,
+            'right': self.button_class.right,
+            'middle': self.button_class.middle,
+            'mouse4': getattr(self.button_class, 'x1', getattr(self.button_class, 'x_button1', 5)),
+            'mouse5': getattr(self.button_class, 'x2', getattr(self.button_class, 'x_button2', 6)),
+            'mouse6': 7,
+            'mouse7': 8,
+            'mouse8': 9,
+            'mouse9': 10,
+            'mouse10': 11,
+        }
+        return button_map.get(normalized)
+
+    def press(self, button_name):
+        normalized = self.normalize_button_name(button_name)
+        if not normalized or self.states.get(normalized):
+            return bool(normalized)
+        button = self.get_button(button_name)
+        if button is None:
+            return False
+        if normalized in ['left', 'right', 'middle']:
+            self.controller.press(button)
+            self.states[normalized] = True
+            return True
+        return False
+
+    def release(self, button_name):
+        normalized = self.normalize_button_name(button_name)
+        if not normalized or not self.states.get(normalized):
+            return bool(normalized)
+        button = self.get_button(button_name)
+        if button is None:
+            return False
+        if normalized in ['left', 'right', 'middle']:
+            self.controller.release(button)
+            self.states[normalized] = False
+            return True
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark mouse press/release dispatch")
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for label, cls in (("legacy", LegacyMouseController), ("current", client.AXISMouseController)):
+        controller = _attach_fake_backend(cls())
+        for name in ("left", "Left Click", "mouse 3"):
+            def cycle(press=controller.press, release=controller.release, name=name):
+                press(name)
+                release(name)
+            results[f"press+release[{label}:{name}]"] = measure(cycle, args.repeat, args.number)
+
+    return finish(args, "buttons", results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Replay synthetic click streams through the mouse hook dispatch
+
+Compares the previous per-listener ``on_click`` matcher (string building
+plus substring checks on every event) with InputHookService, which matches
+by set membership on precomputed backend button objects. Buttons are an
+Enum shaped like pynput's ``Button`` so ``str()`` costs are realistic.
+
+    python benchmarks/bench_clicks.py
+    python benchmarks/bench_clicks.py --events 200000 --listeners 2 --save clicks.json
+"""
+import argparse
+import enum
+import random
+import sys
+from types import MappingProxyType
+
+from harness import add_result_args, finish, measure
+
+import client
+
+
+class Button(enum.Enum):
+    unknown = 0
+    left = 1
+    middle = 2
+    right = 3
+    x1 = 8
+    x2 = 9
+
+
+def legacy_on_click(button, is_pressed_state, on_press, on_release):
+    """Replica of the previous AXISMouseListener on_click closure"""
+    def on_click(x, y, btn, pressed):
+        try:
+            btn_str = str(btn).lower() if btn is not None else ''
+            button_str = str(button).lower() if button is not None else ''
+        except Exception:
+            btn_str = ''
+            button_str = ''
+
+        matched = False
+        if btn == button:
+            matched = True
+        elif btn_str == button_str:
+            matched = True
+        else:
+            for key in ('left', 'right', 'middle', 'x1', 'x2', 'x_button1', 'x_button2', 'mouse4', 'mouse5'):
+                if key in btn_str and key in button_str:
+                    matched = True
+                    break
+
+        if matched:
+            if pressed and not is_pressed_state[0]:
+                is_pressed_state[0] = True
+                on_press()
+            elif not pressed and is_pressed_state[0]:
+                is_pressed_state[0] = False
+                on_release()
+    return on_click
+
+
+def click_stream(count, seed=7):
+    """Press/release pairs over all buttons, weighted towards the left button like real input"""
+    rng = random.Random(seed)
+    buttons = [Button.left] * 6 + [Button.right] * 2 + [Button.middle, Button.x1, Button.x2]
+    events = []
+    while len(events) < count:
+        btn = rng.choice(buttons)
+        events.append((0, 0, btn, True))
+        events.append((0, 0, btn, False))
+    return events[:count]
+
+
+def fake_controller():
+    controller = client.AXISMouseController()
+    controller.button_class = Button
+    controller.buttons = MappingProxyType({
+        'left': Button.left, 'right': Button.right, 'middle': Button.middle,
+        'mouse4': Button.x1, 'mouse5': Button.x2,
+    })
+    controller._resolved.clear()
+    return controller
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark mouse hook event matching")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--listeners", type=int, default=2, help="number of bound macros")
+    parser.add_argument("--repeat", type=int, default=5)
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    events = click_stream(args.events)
+    targets = ["mouse4", "mouse5", "middle", "right"][:max(1, args.listeners)]
+    noop = lambda: None
+
+    legacy_handlers = [legacy_on_click(getattr(Button, {"mouse4": "x1", "mouse5": "x2"}.get(t, t)), [False], noop, noop)
+                       for t in targets]
+
+    def replay_legacy():
+        for event in events:
+            for handler in legacy_handlers:
+                handler(*event)
+
+    controller = fake_controller()
+    client._mouse_controller = controller
+    service = client.InputHookService()
+    service._ensure_mouse_listener = lambda: None
+    for target in targets:
+        listener = client.AXISMouseListener(target, noop, noop)
+        listener.running = True
+        service.register_mouse(controller.equivalent_buttons(target), listener._on_button)
+    on_click = service._on_click
+
+    def replay_current():
+        for event in events:
+            on_click(*event)
+
+    results = {
+        f"replay[legacy x{len(targets)}]": measure(replay_legacy, args.repeat),
+        f"replay[current x{len(targets)}]": measure(replay_current, args.repeat),
+    }
+    for name, stats in results.items():
+        stats["events_per_s"] = len(events) / stats["median_s"]
+        print(f"  {name}: {stats['events_per_s']:,.0f} events/s")
+
+    return finish(args, "clicks", results, events=len(events), listeners=len(targets))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""End-to-end macro engine throughput against the recording backend
+
+Drives trigger clicks through InputHookService -> AXISMouseListener ->
+AXISKeyManager -> RecordingBackend, so the whole Python-side input path is
+exercised without real devices. The recorded actions are checked before
+timings are reported.
+
+    python benchmarks/bench_engine.py
+    python benchmarks/bench_engine.py --triggers 50000 --save engine.json
+"""
+import argparse
+import sys
+
+from harness import add_result_args, finish, measure
+
+import client
+
+
+def build_engine():
+    backend = client.RecordingBackend()
+    client.set_input_backend(backend)
+    manager = client.get_key_manager()
+    service = client.InputHookService()
+    service._ensure_mouse_listener = lambda: None
+    buttons = client.get_mouse_controller().equivalent_buttons("mouse4")
+
+    # drag-select style: hold select while the trigger is down
+    drag = client.AXISMouseListener("mouse4", lambda: manager.press("left"), lambda: manager.release("left"))
+    drag.running = True
+    service.register_mouse(buttons, drag._on_button)
+
+    # double-edit style: chord pressed and released as one batch each
+    chord = client.AXISMouseListener("mouse4", lambda: manager.press_many(("shift", "right")),
+                                     lambda: manager.release_many(("right", "shift")))
+    chord.running = True
+    service.register_mouse(buttons, chord._on_button)
+    return backend, service._on_click, buttons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the macro engine against the recording backend")
+    parser.add_argument("--triggers", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    backend, on_click, buttons = build_engine()
+    trigger = next(iter(buttons))
+    unrelated = object()
+
+    def replay():
+        backend.clear()
+        for _ in range(args.triggers):
+            on_click(0, 0, trigger, True)
+            on_click(0, 0, unrelated, True)
+            on_click(0, 0, trigger, False)
+
+    replay()
+    batches = len(backend.batches)
+    expected = args.triggers * 4
+    if batches != expected:
+        print(f"unexpected batch count {batches}, wanted {expected}")
+        return 2
+
+    results = {"trigger_cycle[recording]": measure(replay, args.repeat)}
+    results["trigger_cycle[recording]"]["per_trigger_s"] = results["trigger_cycle[recording]"]["median_s"] / args.triggers
+    print(f"  {args.triggers} triggers, {batches} batches, "
+          f"{results['trigger_cycle[recording]']['per_trigger_s'] * 1e6:.2f} us per trigger cycle")
+    return finish(args, "engine", results, triggers=args.triggers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
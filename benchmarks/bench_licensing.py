@@ -0,0 +1,233 @@
+"""Benchmarks for the licensing and key-store hot paths
+
+Builds a synthetic key database (bound, unbound, revoked and expired
+records) in a temporary directory and times the admin and client paths
+against it. Nothing in the real keys/ directory or keys.json is touched.
+
+    python benchmarks/bench_licensing.py --sizes 10000
+    python benchmarks/bench_licensing.py --sizes 10000,100000,1000000 --save run.json
+    python benchmarks/bench_licensing.py --sizes 10000 --compare run.json
+"""
+import argparse
+import contextlib
+import http.server
+import io
+import json
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+
+from harness import add_result_args, finish, measure
+
+import client
+import keygen
+
+HWID = "709aa4f803bf26246ee9351e554e61a3fdd225279a4303dcf591d5ac2e299472"
+MIX = (("bound", 0.40), ("unbound", 0.25), ("revoked", 0.15), ("expired", 0.20))
+
+
+def _random_key(rng):
+    alphabet = string.ascii_uppercase + string.digits
+    return "-".join("".join(rng.choices(alphabet, k=4)) for _ in range(4))
+
+
+def generate_records(count, seed=1234):
+    """Return ``{key: record}`` with the bound/unbound/revoked/expired mix in MIX"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    kinds = [kind for kind, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    records = {}
+    while len(records) < count:
+        key = _random_key(rng)
+        if key in records:
+            continue
+        kind = rng.choices(kinds, weights)[0]
+        created = now - timedelta(days=rng.randint(1, 60))
+        if kind == "expired":
+            expires = now - timedelta(days=rng.randint(1, 30))
+        else:
+            expires = now + timedelta(days=rng.randint(1, 365))
+        records[key] = {
+            "key": key,
+            "hwid": None if kind == "unbound" else f"{rng.getrandbits(256):064x}",
+            "expires": expires.isoformat(),
+            "revoked": kind == "revoked",
+            "created": created.isoformat(),
+        }
+    return records
+
+
+def write_database(directory, records, per_key_files=True):
+    keys_dir = os.path.join(directory, "keys")
+    os.makedirs(keys_dir, exist_ok=True)
+    if per_key_files:
+        for key, rec in records.items():
+            with open(os.path.join(keys_dir, f"{key}.json"), "w") as f:
+                json.dump(rec, f, indent=4)
+    keys_json = os.path.join(directory, "keys.json")
+    with open(keys_json, "w") as f:
+        json.dump(records, f, indent=4)
+    return keys_dir, keys_json
+
+
+@contextlib.contextmanager
+def serve_file(path):
+    """Serve ``path`` at http://127.0.0.1:<port>/keys.json, standing in for GitHub raw"""
+    with open(path, "rb") as f:
+        body = f.read()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/keys.json"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextlib.contextmanager
+def patched(module, **values):
+    saved = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def stubbed_license_manager():
+    mgr = client.LicenseManager()
+    mgr._get_mac = lambda: "00:11:22:33:44:55"
+    mgr._get_hostname = lambda: "bench-host"
+    mgr._get_platform_info = lambda: "Windows|bench-host|10|10.0.19045|AMD64|Intel64"
+    mgr._get_disk_serial = lambda: "S4EWNX0N123456"
+    return mgr
+
+
+def bench_index(records, repeat):
+    """Secondary index build, lookups and incremental updates; lookups should stay well under 1 ms"""
+    count = len(records)
+    index = keygen.KeyIndex(records.values())
+    now = datetime.now(timezone.utc).timestamp()
+    week = now + 7 * 86400
+    sample = next(r for r in records.values() if r["hwid"])
+    probe = dict(sample, key="ZZZZ-ZZZZ-ZZZZ-ZZZZ")
+    index.count(keygen.STATUS_ACTIVE, now)  # settle the lazily advanced expired set
+
+    def update():
+        index.add(probe)
+        index.remove(probe["key"])
+
+    return {
+        f"KeyIndex.build[{count}]": measure(lambda: keygen.KeyIndex(records.values()), min(repeat, 3)),
+        f"KeyIndex.keys_for_hwid[{count}]": measure(lambda: index.keys_for_hwid(sample["hwid"]), repeat, 1000),
+        f"KeyIndex.expiring_7d[{count}]": measure(lambda: index.query(expires_after=now, expires_before=week,
+                                                                      limit=100, now=now), repeat, 100),
+        f"KeyIndex.count_active[{count}]": measure(lambda: index.count(keygen.STATUS_ACTIVE, now), repeat, 100),
+        f"KeyIndex.revoked_first_100[{count}]": measure(
+            lambda: index.query(status=keygen.STATUS_REVOKED, limit=100, now=now), repeat, 100),
+        f"KeyIndex.add_remove[{count}]": measure(update, repeat, 100),
+    }
+
+
+def bench_size(count, repeat, per_key_files):
+    results = {}
+    records = generate_records(count)
+    bound_key = next(k for k, r in records.items() if r["hwid"] and not r["revoked"]
+                     and r["expires"] > datetime.now(timezone.utc).isoformat())
+    records[bound_key]["hwid"] = HWID
+    results.update(bench_index(records, repeat))
+
+    workdir = tempfile.mkdtemp(prefix=f"axis-bench-{count}-")
+    try:
+        keys_dir, keys_json = write_database(workdir, records, per_key_files)
+        central_json = os.path.join(workdir, "central.json")
+        client_json = os.path.join(workdir, "client_keys.json")
+        shutil.copyfile(keys_json, client_json)
+
+        with patched(keygen, KEYS_DIR=keys_dir, KEYS_JSON=central_json), \
+                patched(client, KEY_DB_FILE=client_json):
+            if per_key_files:
+                results[f"load_all_keys[{count}]"] = measure(keygen.load_all_keys, repeat)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results[f"sync_keys_to_central[{count}]"] = measure(keygen.sync_keys_to_central, repeat)
+
+            results[f"_load_keys[{count}]"] = measure(client._load_keys, repeat)
+
+            mgr = stubbed_license_manager()
+            results[f"_check_key_authority[{count}]"] = measure(
+                lambda: mgr._check_key_authority(bound_key, HWID), repeat)
+
+            with serve_file(keys_json) as url, patched(client, KEYS_REMOTE_URL=url), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                results[f"sync_keys_from_github[{count}]"] = measure(client.sync_keys_from_github, repeat)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def bench_codec(repeat):
+    mgr = stubbed_license_manager()
+    expires = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+    encoded = mgr._encode_license("ABCD-EFGH-IJKL-MNOP", expires, HWID)
+    return {
+        "_encode_license": measure(lambda: mgr._encode_license("ABCD-EFGH-IJKL-MNOP", expires, HWID), repeat, 10000),
+        "_decode_license": measure(lambda: mgr._decode_license(encoded), repeat, 10000),
+    }
+
+
+def bench_hwid(repeat):
+    mgr = stubbed_license_manager()
+
+    def cold():
+        mgr._cached_hwid = None
+        mgr.get_hwid()
+
+    return {
+        "get_hwid[cold]": measure(cold, repeat, 10000),
+        "get_hwid[cached]": measure(mgr.get_hwid, repeat, 100000),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark licensing and key-store paths")
+    parser.add_argument("--sizes", default="10000", help="comma separated record counts, e.g. 10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-key-files", action="store_true",
+                        help="skip per-key files (load_all_keys/sync_keys_to_central) for very large sizes")
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = {}
+    results.update(bench_codec(args.repeat))
+    results.update(bench_hwid(args.repeat))
+    for count in sizes:
+        print(f"Generating {count} records...")
+        results.update(bench_size(count, args.repeat, not args.no_key_files))
+
+    return finish(args, "licensing", results, sizes=sizes)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
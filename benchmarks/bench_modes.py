@@ -0,0 +1,118 @@
+"""Startup time and resident memory: headless engine vs. the Tk GUI
+
+Each mode runs in a fresh interpreter that imports client, brings the macro
+engine up from a throwaway profile file and reports the time until ready,
+peak RSS and whether tkinter got imported. License checks and the GitHub
+sync are stubbed out and injection goes to the recording backend, so only
+local startup cost is measured. The GUI mode needs a display.
+
+    python benchmarks/bench_modes.py
+    python benchmarks/bench_modes.py --runs 10 --save modes.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from harness import REPO_DIR, add_result_args, finish
+
+CHILD = r"""
+import json, os, sys, time
+started = time.perf_counter()
+import client
+
+client.sync_keys_from_github = lambda: False
+client.LicenseManager.is_license_valid = lambda self: True
+client.set_input_backend(client.RecordingBackend())
+profiles = client.ProfileStore(sys.argv[2]).load()
+
+if sys.argv[1] == "headless":
+    client.start_headless_engine("bench", profiles)
+else:
+    root = client.tk.Tk()
+    client.MacroGUI(root, profiles=profiles)
+    root.update()
+ready = time.perf_counter() - started
+
+def peak_rss():
+    try:
+        import resource
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    except ImportError:
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                    "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                    "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize
+
+print(json.dumps({"ready_s": ready, "peak_rss": peak_rss(), "tkinter": "tkinter" in sys.modules}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+PROFILE = {"drag_key": "mouse4", "select_key": "left",
+           "double_edit_key": "mouse5", "double_edit_drag": "f", "double_edit_select": "left",
+           "double_edit_delay": 0.5}
+
+
+def run_mode(mode, profiles_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("AXIS_TRACE", None)
+    env.pop("AXIS_LATENCY", None)
+    proc = subprocess.run([sys.executable, "-c", CHILD, mode, profiles_path],
+                          capture_output=True, text=True, env=env, cwd=REPO_DIR, timeout=60)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError((proc.stderr.strip().splitlines() or ["no output"])[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare headless and GUI startup cost")
+    parser.add_argument("--runs", type=int, default=5)
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiles_path = os.path.join(tmp, "macro_profiles.json")
+        with open(profiles_path, "w") as f:
+            json.dump({"active": "bench", "profiles": {"bench": PROFILE}}, f)
+
+        results = {}
+        for mode in ("headless", "gui"):
+            try:
+                samples = [run_mode(mode, profiles_path) for _ in range(args.runs)]
+            except Exception as e:
+                print(f"  {mode:<9} unavailable: {e}")
+                continue
+            ready = [sample["ready_s"] for sample in samples]
+            rss = [sample["peak_rss"] for sample in samples]
+            results[f"startup[{mode}]"] = {
+                "median_s": statistics.median(ready), "min_s": min(ready),
+                "peak_rss_mb": statistics.median(rss) / 2 ** 20,
+                "tkinter_imported": any(sample["tkinter"] for sample in samples),
+            }
+            stats = results[f"startup[{mode}]"]
+            print(f"  {mode:<9} ready {stats['median_s'] * 1e3:8.1f} ms (min {stats['min_s'] * 1e3:.1f}), "
+                  f"peak RSS {stats['peak_rss_mb']:6.1f} MB, tkinter imported: {stats['tkinter_imported']}")
+
+    return finish(args, "modes", results, runs=args.runs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Publish time: git CLI push vs. direct contents API uploads
+
+Builds a synthetic key store in a temporary directory and publishes it
+with both backends: the git path pushes to a local bare repository, the
+API path uploads to the in-process FakeGitHub server. Each backend runs an
+initial publish, a series of single-key changes and a publish with nothing
+changed. ``--latency-ms`` delays every fake API request to stand in for
+the round trip to api.github.com; the git remote is local, so the git path
+gets no network cost at all and its numbers are a lower bound.
+
+The API run also checks that the fake remote ends up holding exactly the
+local files, and that a file changed remotely behind the publisher's back
+is reported as a conflict rather than overwritten.
+
+    python benchmarks/bench_publish.py
+    python benchmarks/bench_publish.py --keys 1000 --rounds 10 --latency-ms 40 --save publish.json
+    python benchmarks/bench_publish.py --history 2000
+"""
+import argparse
+import os
+import pathlib
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from harness import add_result_args, finish
+
+import keygen
+from bench_licensing import generate_records, write_database
+from fake_github import FakeGitHub
+
+REPO = "bench/auth-data"
+TOKEN = "bench-token"
+USERNAME = "bench"
+
+
+def use_store(directory):
+    keygen.APP_DIR = directory
+    keygen.KEYS_DIR = os.path.join(directory, "keys")
+    keygen.KEYS_JSON = os.path.join(directory, "keys.json")
+    keygen.PUBLISH_STATE_FILE = os.path.join(directory, "publish_state.json")
+    keygen.PUBLISH_WORKTREE = os.path.join(directory, ".publish")
+
+
+def quiet_log(msg):
+    pass
+
+
+def timed(publish):
+    started = time.perf_counter()
+    ok, message = publish()
+    elapsed = time.perf_counter() - started
+    if not ok:
+        raise RuntimeError(message)
+    return elapsed
+
+
+def run_rounds(name, publish, keys, rounds, rng):
+    results = {}
+    initial = timed(publish)
+    results[f"publish[{name}, initial]"] = {"median_s": initial, "min_s": initial}
+    samples = []
+    for round_number in range(rounds):
+        keygen.update_key(rng.choice(keys), lambda record: record.update(note=f"round {round_number}"), sync=False)
+        samples.append(timed(publish))
+    results[f"publish[{name}, one change]"] = {"median_s": statistics.median(samples), "min_s": min(samples)}
+    unchanged = timed(publish)
+    results[f"publish[{name}, no change]"] = {"median_s": unchanged, "min_s": unchanged}
+    return results
+
+
+def fast_import(remote, commits):
+    """Append ``(message, keys.json content)`` commits to the remote's main branch"""
+    found = subprocess.run(["git", "--git-dir", remote, "rev-parse", "-q", "--verify", "main"], capture_output=True)
+    stream = []
+    for number, (message, content) in enumerate(commits):
+        stream.append(b"commit refs/heads/main\n")
+        stream.append(f"committer bench <bench@example.com> {1_600_000_000 + number} +0000\n".encode())
+        stream.append(b"data %d\n%s\n" % (len(message), message))
+        if number == 0 and found.returncode == 0:
+            stream.append(b"from refs/heads/main^0\n")
+        stream.append(b"M 644 inline keys.json\ndata %d\n%s\n" % (len(content), content))
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=remote, input=b"".join(stream), check=True)
+    return subprocess.run(["git", "--git-dir", remote, "rev-parse", "main"],
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+def seed_history(remote, commits, rng):
+    """Give the bare remote ``commits`` earlier revisions of a sizeable keys.json"""
+    fast_import(remote, ((f"history {number}".encode(),
+                          "".join(f"{rng.getrandbits(128):032x}\n" for _ in range(2000)).encode())
+                         for number in range(commits)))
+
+
+def bench_git(workdir, keys, rounds, rng, history):
+    remote = os.path.join(workdir, "remote.git")
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", remote], check=True)
+    subprocess.run(["git", "--git-dir", remote, "config", "uploadpack.allowFilter", "true"], check=True)  # as on GitHub
+    if history:
+        seed_history(remote, history, rng)
+    keygen.GITHUB_REMOTE_URL = pathlib.Path(remote).as_uri()  # file:// so --depth applies
+    with open(os.path.join(workdir, "stray notes.txt"), "w") as f:
+        f.write("must never be published\n")
+
+    def publish():
+        return keygen.publish_to_github(USERNAME, TOKEN, REPO, log=quiet_log)
+
+    name = f"git, {history} commits of history" if history else "git"
+    results = run_rounds(name, publish, keys, rounds, rng)
+
+    # another admin publishes in between; ours must land on top of theirs, not replace it
+    theirs = fast_import(remote, [(b"published elsewhere", b"{}\n")])
+    keygen.update_key(rng.choice(keys), lambda record: record.update(note="after theirs"), sync=False)
+    ok, _ = publish()
+    kept = ok and subprocess.run(["git", "--git-dir", remote, "merge-base", "--is-ancestor", theirs, "main"]).returncode == 0
+
+    committed = subprocess.run(["git", "--git-dir", remote, "ls-tree", "-r", "--name-only", "main"],
+                               capture_output=True, text=True, check=True).stdout.splitlines()
+    only_data = all(keygen.is_published_path(path) for path in committed)
+    depth = subprocess.run(["git", "-C", keygen.PUBLISH_WORKTREE, "rev-list", "--count", "HEAD"],
+                           capture_output=True, text=True).stdout.strip()
+    print(f"  {name}: {len(committed)} files on the remote, only key store files: {only_data}, "
+          f"concurrent publish kept: {kept}, commits in publish worktree: {depth}")
+    return results, only_data and kept
+
+
+def bench_api(keys, rounds, rng, latency):
+    with FakeGitHub(REPO, TOKEN, latency=latency) as server:
+        def publish():
+            return keygen.publish_via_api(USERNAME, TOKEN, REPO, log=quiet_log, api_url=server.url)
+
+        results = run_rounds("api", publish, keys, rounds, rng)
+        in_sync = server.files == keygen.publish_artifacts()
+        print(f"  api: {server.requests} requests over {server.connections} connection(s), "
+              f"{server.commits} commits, remote matches local: {in_sync}")
+
+        # someone else edits a shard on the remote; our next change to it must not overwrite theirs
+        key = rng.choice(keys)
+        path = f"keys/{key}.json"
+        theirs = server.files[path] = b'{"edited": "elsewhere"}'
+        keygen.update_key(key, lambda record: record.update(note="ours"), sync=False)
+        ok, _ = publish()
+        detected = not ok and server.files[path] == theirs
+        ok_again, _ = publish()
+        overwritten = ok_again and server.files == keygen.publish_artifacts()
+        print(f"  api: remote edit reported as conflict: {detected}, overwritten on the next publish: {overwritten}")
+        return results, in_sync and detected and overwritten
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare git and contents API publish times")
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5, help="single-key changes published per backend")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every fake API request")
+    parser.add_argument("--history", type=int, default=0,
+                        help="also run the git backend against a remote with this many earlier commits")
+    add_result_args(parser)
+    args = parser.parse_args(argv)
+
+    records = generate_records(args.keys)
+    keys = list(records)
+    results = {}
+    passed = True
+    runs = [("git", 0), ("api", 0)]
+    if args.history:
+        runs.insert(1, ("git", args.history))
+    for backend, history in runs:
+        workdir = tempfile.mkdtemp(prefix=f"axis-publish-{backend}-")
+        try:
+            write_database(workdir, records)
+            use_store(workdir)
+            rng = random.Random(7)
+            if backend == "git":
+                try:
+                    run_results, ok = bench_git(workdir, keys, args.rounds, rng, history)
+                except (OSError, subprocess.CalledProcessError, RuntimeError) as e:
+                    print(f"  git unavailable: {e}")
+                    continue
+            else:
+                run_results, ok = bench_api(keys, args.rounds, rng, args.latency_ms / 1000)
+            results.update(run_results)
+            passed &= ok
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    code = finish(args, "publish", results, keys=args.keys, rounds=args.rounds,
+                  latency_ms=args.latency_ms, history=args.history)
+    return code or (0 if passed else 1)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
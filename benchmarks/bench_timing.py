@@ -0,0 +1,83 @@
+"""Timing accuracy of scheduled macro actions under load
+
+Schedules batches of delayed actions on the TimerScheduler while optional
+CPU-bound threads compete for the GIL, and compares the lateness
+percentiles with plain ``time.sleep`` scheduling.
+
+    python benchmarks/bench_timing.py
+    python benchmarks/bench_timing.py --actions 500 --load-threads 2
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from harness import add_repo_to_path
+
+add_repo_to_path()
+
+import client
+
+
+def busy(stop):
+    x = 0
+    while not stop.is_set():
+        x = (x * 31 + 7) % 1000003
+
+
+def sleep_lateness(delays):
+    stats = client.JitterStats(maxlen=len(delays))
+    for delay in delays:
+        deadline = time.perf_counter_ns() + int(delay * 1e9)
+        time.sleep(delay)
+        stats.record(time.perf_counter_ns() - deadline)
+    return stats.percentiles()
+
+
+def scheduler_lateness(delays):
+    scheduler = client.TimerScheduler()
+    done = threading.Event()
+    remaining = [len(delays)]
+
+    def fire():
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            done.set()
+
+    for delay in delays:
+        scheduler.schedule(delay, fire, tag="bench")
+        time.sleep(delay / 4)
+    done.wait(60)
+    report = scheduler.jitter_report().get("bench")
+    scheduler.stop()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure scheduled action jitter")
+    parser.add_argument("--actions", type=int, default=200)
+    parser.add_argument("--min-delay", type=float, default=0.002)
+    parser.add_argument("--max-delay", type=float, default=0.030)
+    parser.add_argument("--load-threads", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(3)
+    delays = [rng.uniform(args.min_delay, args.max_delay) for _ in range(args.actions)]
+
+    stop = threading.Event()
+    workers = [threading.Thread(target=busy, args=(stop,), daemon=True) for _ in range(args.load_threads)]
+    for worker in workers:
+        worker.start()
+    try:
+        for label, func in (("time.sleep", sleep_lateness), ("TimerScheduler", scheduler_lateness)):
+            stats = func(delays)
+            print(f"  {label:<15} n={stats['count']:<5} p50={stats['p50_us']:9.1f} us  "
+                  f"p99={stats['p99_us']:9.1f} us  max={stats['max_us']:9.1f} us")
+    finally:
+        stop.set()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
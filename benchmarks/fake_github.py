@@ -0,0 +1,162 @@
+"""Local stand-in for the parts of the GitHub REST API keygen publishes through
+
+Serves the recursive tree listing and the contents API (GET/PUT/DELETE)
+for one repository and branch from memory, with GitHub's SHA checks: a
+write must name the file's current blob SHA or is refused with 409/422.
+Connections are kept alive like api.github.com, and an optional per-request
+delay stands in for network round trips.
+
+    with FakeGitHub("owner/repo", "token", latency=0.02) as server:
+        keygen.publish_via_api("user", "token", "owner/repo", api_url=server.url)
+"""
+import base64
+import json
+import re
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from harness import add_repo_to_path
+
+add_repo_to_path()
+
+import keygen
+
+
+class FakeGitHub:
+    def __init__(self, repo: str, token: str, branch: str = "main", latency: float = 0.0):
+        self.repo = repo
+        self.token = token
+        self.branch = branch
+        self.latency = latency
+        self.files = {}  # path -> bytes
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.commits = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        fake = self
+
+        class Handler(RequestHandler):
+            server_state = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def sha(self, path):
+        data = self.files.get(path)
+        return None if data is None else keygen.git_blob_sha(data)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    server_state = None
+
+    def setup(self):
+        super().setup()
+        with self.server_state.lock:
+            self.server_state.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        fake = self.server_state
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+        if fake.latency:
+            time.sleep(fake.latency)
+        with fake.lock:
+            fake.requests += 1
+            if self.headers.get("Authorization") != f"Bearer {fake.token}":
+                return self.reply(401, {"message": "Bad credentials"})
+
+            url = urllib.parse.urlsplit(self.path)
+            prefix = f"/repos/{fake.repo}/"
+            if not url.path.startswith(prefix):
+                return self.reply(404, {"message": "Not Found"})
+            route = url.path[len(prefix):]
+
+            if method == "GET" and route == f"git/trees/{fake.branch}":
+                if not fake.files:
+                    return self.reply(409, {"message": "Git Repository is empty."})
+                tree = [{"path": path, "mode": "100644", "type": "blob", "sha": fake.sha(path)}
+                        for path in sorted(fake.files)]
+                return self.reply(200, {"sha": "0" * 40, "tree": tree, "truncated": False})
+
+            match = re.fullmatch(r"contents/(.+)", route)
+            if not match:
+                return self.reply(404, {"message": "Not Found"})
+            path = urllib.parse.unquote(match.group(1))
+            current = fake.sha(path)
+
+            if method == "GET":
+                if current is None:
+                    return self.reply(404, {"message": "Not Found"})
+                return self.reply(200, {"path": path, "sha": current, "encoding": "base64",
+                                        "content": base64.b64encode(fake.files[path]).decode()})
+
+            if body.get("branch", fake.branch) != fake.branch:
+                return self.reply(404, {"message": "Branch not found"})
+            sent = body.get("sha")
+            if method == "PUT":
+                if current is not None and not sent:
+                    return self.reply(422, {"message": "Invalid request.\n\n\"sha\" wasn't supplied."})
+                if sent and sent != current:
+                    return self.reply(409, {"message": f"{path} does not match {sent}"})
+                fake.files[path] = base64.b64decode(body["content"])
+                fake.commits += 1
+                return self.reply(201 if current is None else 200,
+                                  {"content": {"path": path, "sha": fake.sha(path)},
+                                   "commit": {"message": body.get("message")}})
+            if method == "DELETE":
+                if current is None:
+                    return self.reply(404, {"message": "Not Found"})
+                if sent != current:
+                    return self.reply(409, {"message": f"{path} does not match {sent}"})
+                del fake.files[path]
+                fake.commits += 1
+                return self.reply(200, {"content": None, "commit": {"message": body.get("message")}})
+            return self.reply(405, {"message": "Method Not Allowed"})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
@@ -0,0 +1,107 @@
+"""Shared timing, result storage and regression comparison for the benchmarks"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def add_repo_to_path():
+    """Make the repository modules importable; scripts that import nothing else from here call it"""
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+
+add_repo_to_path()
+
+
+def measure(func, repeat=5, number=1, setup=None):
+    """Time ``func`` ``number`` times per round over ``repeat`` rounds; returns per-call seconds"""
+    rounds = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {
+        "median_s": statistics.median(rounds),
+        "min_s": min(rounds),
+        "max_s": max(rounds),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def format_seconds(value):
+    if value >= 1:
+        return f"{value:.3f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.3f} ms"
+    if value >= 1e-6:
+        return f"{value * 1e6:.3f} us"
+    return f"{value * 1e9:.1f} ns"
+
+
+def print_results(results):
+    width = max((len(name) for name in results), default=0)
+    for name, stats in results.items():
+        print(f"  {name:<{width}}  median {format_seconds(stats['median_s']):>12}  min {format_seconds(stats['min_s']):>12}")
+
+
+def save_results(path, suite, results, **meta):
+    payload = {
+        "suite": suite,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            **meta,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=4)
+
+
+def compare_results(baseline, current, threshold):
+    """Return (name, old, new, ratio) for every case slower than ``1 + threshold``"""
+    regressions = []
+    old_results = baseline.get("results", {})
+    for name, stats in current.items():
+        old = old_results.get(name)
+        if not old or not old.get("median_s"):
+            continue
+        ratio = stats["median_s"] / old["median_s"]
+        if ratio > 1 + threshold:
+            regressions.append((name, old["median_s"], stats["median_s"], ratio))
+    return regressions
+
+
+def add_result_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--compare", help="compare against a previously saved JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown before flagging")
+
+
+def finish(args, suite, results, **meta):
+    """Print, optionally save and compare results; returns a process exit code"""
+    print_results(results)
+    if args.save:
+        save_results(args.save, suite, results, **meta)
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"REGRESSION {name}: {format_seconds(old)} -> {format_seconds(new)} (x{ratio:.2f})")
+        if not regressions:
+            print(f"No regressions above {args.threshold * 100:.0f}% against {args.compare}")
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,137 @@
+"""Import-time benchmark for client.py
+
+Runs ``python -X importtime -c "import client"`` several times, parses the
+importtime trace and reports the total import cost plus the most expensive
+modules. Heavy subsystems that must stay lazy (tkinter, keyboard, pynput,
+win32) are flagged if they show up at import.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --save import_baseline.json
+    python benchmarks/import_time.py --baseline import_baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ("tkinter", "keyboard", "pynput", "win32api", "win32con")
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue  # header line
+    return modules
+
+
+def run_once(target):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("AXIS_TRACE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure(target, runs, top):
+    samples = [run_once(target) for _ in range(runs)]
+
+    totals = [s[target][1] for s in samples if target in s]
+    cumulative = {}
+    own = {}
+    for sample in samples:
+        for name, (self_us, cum_us) in sample.items():
+            own.setdefault(name, []).append(self_us)
+            cumulative.setdefault(name, []).append(cum_us)
+
+    def ranked(table):
+        medians = {name: statistics.median(vals) for name, vals in table.items() if name != target}
+        return sorted(medians.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    loaded = set(cumulative)
+    return {
+        "target": target,
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "total_us": statistics.median(totals) if totals else None,
+        "total_us_min": min(totals) if totals else None,
+        "module_count": statistics.median(len(s) for s in samples),
+        "lazy_violations": sorted(m for m in loaded if m.split(".")[0] in LAZY_MODULES),
+        "top_cumulative_us": ranked(cumulative),
+        "top_self_us": ranked(own),
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return a list of regression messages between two reports"""
+    regressions = []
+    old, new = baseline.get("total_us"), current.get("total_us")
+    if old and new and new > old * (1 + threshold):
+        regressions.append(f"total import time {old / 1000:.1f} ms -> {new / 1000:.1f} ms (+{(new / old - 1) * 100:.0f}%)")
+    if current.get("module_count", 0) > baseline.get("module_count", 0):
+        regressions.append(f"module count {baseline.get('module_count')} -> {current.get('module_count')}")
+    added = set(current["lazy_violations"]) - set(baseline.get("lazy_violations", []))
+    if added:
+        regressions.append("now imported eagerly: " + ", ".join(sorted(added)))
+    return regressions
+
+
+def print_report(report):
+    print(f"import {report['target']}: median {report['total_us'] / 1000:.1f} ms "
+          f"(min {report['total_us_min'] / 1000:.1f} ms, {report['module_count']:.0f} modules, {report['runs']} runs)")
+    if report["lazy_violations"]:
+        print("  eagerly imported heavy modules: " + ", ".join(report["lazy_violations"]))
+    print("  top cumulative:")
+    for name, us in report["top_cumulative_us"]:
+        print(f"    {us / 1000:8.2f} ms  {name}")
+    print("  top self:")
+    for name, us in report["top_self_us"]:
+        print(f"    {us / 1000:8.2f} ms  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure import time of client.py")
+    parser.add_argument("--target", default="client")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", help="write the report as JSON")
+    parser.add_argument("--baseline", help="compare against a saved JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    report = measure(args.target, args.runs, args.top)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for msg in regressions:
+            print(f"REGRESSION: {msg}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Multi-threaded stress run for the key state tables
+
+Many threads press and release a small set of keys through
+AXISKeyManager (recording backend) and AXISMouseController (null pynput
+controller) as fast as they can. Afterwards the recorded injections of
+every key must strictly alternate down/up, and release_all() must leave
+nothing held, both in the state tables and in the injected stream.
+
+    python benchmarks/stress_key_state.py
+    python benchmarks/stress_key_state.py --threads 32 --ops 20000
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from harness import add_repo_to_path
+
+add_repo_to_path()
+
+import client
+
+KEYS = ("left", "right", "mouse4", "shift", "ctrl", "a", "f5", "space")
+
+
+class RecordingController:
+    """Stands in for pynput's Controller and records the injected order"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+
+    def press(self, button):
+        with self.lock:
+            self.events.append((button, True))
+
+    def release(self, button):
+        with self.lock:
+            self.events.append((button, False))
+
+
+def check_alternation(events):
+    """Return keys whose injected transitions do not alternate down/up starting with down"""
+    last = {}
+    broken = set()
+    for key, down in events:
+        if last.get(key, False) == down:
+            broken.add(key)
+        last[key] = down
+    stuck = {key for key, down in last.items() if down}
+    return broken, stuck
+
+
+def hammer(worker, ops, seed, keys):
+    rng = random.Random(seed)
+    for _ in range(ops):
+        key = rng.choice(keys)
+        if rng.random() < 0.5:
+            worker.press(key) if rng.random() < 0.8 else worker.press_many((key, rng.choice(keys)))
+        else:
+            worker.release(key) if rng.random() < 0.8 else worker.release_many((key, rng.choice(keys)))
+
+
+def stress_key_manager(threads, ops):
+    backend = client.RecordingBackend()
+    client.set_input_backend(backend)
+    manager = client.AXISKeyManager()
+    manager.backend = backend
+
+    workers = [threading.Thread(target=hammer, args=(manager, ops, seed, KEYS)) for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    manager.release_all()
+
+    events = [(action.desc.name, action.down) for action in backend.actions]
+    broken, stuck = check_alternation(events)
+    return elapsed, len(events), broken, stuck, manager.states.held()
+
+
+def stress_mouse_controller(threads, ops):
+    controller = client.AXISMouseController()
+    recorder = RecordingController()
+    controller.controller = recorder
+    controller.pynput_available = True
+
+    class Adapter:
+        press = controller.press
+        release = controller.release
+
+        def press_many(self, keys):
+            for key in keys:
+                controller.press(key)
+
+        def release_many(self, keys):
+            for key in keys:
+                controller.release(key)
+
+    buttons = ("left", "right", "middle", "mouse6")
+    workers = [threading.Thread(target=hammer, args=(Adapter(), ops, seed, buttons)) for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    controller.release_all()
+
+    broken, stuck = check_alternation(recorder.events)
+    return elapsed, len(recorder.events), broken, stuck, controller.states.held()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stress the key state tables from many threads")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=5000, help="operations per thread")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for label, run in (("AXISKeyManager", stress_key_manager), ("AXISMouseController", stress_mouse_controller)):
+        elapsed, injected, broken, stuck, held = run(args.threads, args.ops)
+        ok = not broken and not stuck and not held
+        failed |= not ok
+        print(f"  {label:<20} {args.threads} threads x {args.ops} ops in {elapsed:.2f} s, "
+              f"{injected} injections: {'OK' if ok else 'FAIL'}")
+        if broken:
+            print(f"    non-alternating transitions: {sorted(broken)}")
+        if stuck or held:
+            print(f"    stuck after release_all: injected={sorted(stuck)} table={sorted(held)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Multi-process stress run for key store writes
+
+Writer processes hammer a temporary key store through keygen (locked
+read-modify-write counters on keys/*.json, keys.json rebuilds) and the
+client's ``_save_keys``, while reader processes parse keys.json and key
+files in a tight loop without locking. Afterwards no read may have seen a
+partial file and no counter increment may have been lost.
+
+``--naive`` swaps in plain unlocked in-place writes to show what the run
+catches without the lock and rename.
+
+    python benchmarks/stress_key_store.py
+    python benchmarks/stress_key_store.py --writers 8 --readers 4 --ops 500
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from harness import add_repo_to_path
+
+add_repo_to_path()
+
+import client
+import keygen
+import safe_io
+
+KEYS = 16
+
+
+def setup_worker(workdir, naive):
+    keygen.KEYS_DIR = os.path.join(workdir, "keys")
+    keygen.KEYS_JSON = os.path.join(workdir, "keys.json")
+    client.KEY_DB_FILE = keygen.KEYS_JSON
+    if naive:
+        def plain_write(path, data, lock=None):
+            with open(path, "wb") as f:
+                f.write(data)
+        safe_io.atomic_write_bytes = plain_write
+        safe_io.FileLock.acquire = lambda self: None
+        safe_io.FileLock.release = lambda self: None
+
+
+def bump(record):
+    record["counter"] = record.get("counter", 0) + 1
+    # pad the record so a write is not a single small syscall
+    record["padding"] = "x" * random.randint(2000, 20000)
+
+
+def writer(workdir, naive, seed, ops, keys):
+    setup_worker(workdir, naive)
+    rng = random.Random(seed)
+    increments = 0
+    for _ in range(ops):
+        roll = rng.random()
+        if roll < 0.8:
+            try:
+                keygen.update_key(rng.choice(keys), bump, sync=False)
+                increments += 1
+            except keygen.KeygenError:
+                pass  # naive mode: the writer itself read a torn file
+        elif roll < 0.9:
+            keygen.sync_keys_to_central()
+        else:
+            client._save_keys({key: {"key": key, "blob": "y" * rng.randint(1000, 50000)} for key in keys})
+    return increments
+
+
+def reader(workdir, naive, stop, keys):
+    setup_worker(workdir, naive)
+    rng = random.Random(os.getpid())
+    reads = torn = 0
+    while not stop.is_set():
+        path = keygen.KEYS_JSON if rng.random() < 0.3 else keygen.key_path(rng.choice(keys))
+        try:
+            with open(path, "rb") as f:
+                json.loads(f.read())
+        except FileNotFoundError:
+            continue
+        except PermissionError:
+            continue  # Windows: file is mid-replace; a retry sees the complete new version
+        except ValueError:
+            torn += 1
+        reads += 1
+    return reads, torn
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stress concurrent key store writers and readers")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=300, help="operations per writer")
+    parser.add_argument("--naive", action="store_true", help="use unlocked in-place writes")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="axis-store-stress-")
+    try:
+        setup_worker(workdir, False)
+        os.makedirs(keygen.KEYS_DIR)
+        keys = [keygen.create_key(30, sync=False)["key"] for _ in range(KEYS)]
+        keygen.sync_keys_to_central()
+
+        manager = multiprocessing.Manager()
+        stop = manager.Event()
+        with multiprocessing.Pool(args.writers + args.readers) as pool:
+            readers = [pool.apply_async(reader, (workdir, args.naive, stop, keys)) for _ in range(args.readers)]
+            started = time.perf_counter()
+            writers = [pool.apply_async(writer, (workdir, args.naive, seed, args.ops, keys))
+                       for seed in range(args.writers)]
+            increments = sum(w.get() for w in writers)
+            elapsed = time.perf_counter() - started
+            stop.set()
+            reads, torn = map(sum, zip(*(r.get() for r in readers)))
+
+        counted = sum(keygen.load_key(key).get("counter", 0) for key in keys)
+        lost = increments - counted
+        ok = torn == 0 and lost == 0
+        print(f"  {'naive' if args.naive else 'locked'} writes: {args.writers} writers x {args.ops} ops "
+              f"in {elapsed:.2f} s, {reads} unlocked reads")
+        print(f"  torn reads: {torn}, lost increments: {lost} of {increments}: {'OK' if ok else 'FAIL'}")
+        return 0 if ok else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
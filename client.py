@@ -1,12 +1,11 @@
 # AXIS Macro Controller - Fixed All Errors
 # Python 3.12.0 Complete Version
+import time
+_IMPORT_STARTED_NS = time.perf_counter_ns()
+
 import urllib.request
 import urllib.error
-import tkinter as tk
-from tkinter import messagebox
 import threading
-import keyboard
-import time
 import hashlib
 import base64
 import os
@@ -18,15 +17,170 @@ import socket
 import subprocess
 import sys
 import ctypes
-from typing import Callable
+import atexit
+import functools
+import contextlib
+import importlib
+import heapq
+import array
+import collections
+import itertools
+import queue
+from types import MappingProxyType
+from typing import Callable, NamedTuple
+
+from safe_io import atomic_write_bytes, atomic_write_json, file_lock, read_json
+
+
+# ---------------------------
+# Startup Tracing
+# ---------------------------
+TRACE_ENV_VAR = "AXIS_TRACE"
+TRACE_DEFAULT_FILE = "startup_trace.json"
+
+def _trace_target():
+    """Return the trace file requested via --trace[=path] or AXIS_TRACE, or None"""
+    for arg in sys.argv[1:]:
+        if arg == "--trace":
+            return TRACE_DEFAULT_FILE
+        if arg.startswith("--trace="):
+            return arg.split("=", 1)[1] or TRACE_DEFAULT_FILE
+
+    value = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return TRACE_DEFAULT_FILE
+    return value
+
+
+class StartupTracer:
+    """Collects Chrome-trace compatible span events for the startup path"""
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.events = []
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        if self.enabled:
+            atexit.register(self.write)
+
+    def add(self, name, start_ns, end_ns, **args):
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": "startup",
+            "ph": "X",
+            "ts": start_ns / 1000.0,
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter_ns(), **args)
+
+    def traced(self, name):
+        """Decorator recording a span for every call while tracing is enabled"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add(name, start, time.perf_counter_ns())
+            return wrapper
+        return decorator
+
+    def first_frame(self, root, start_ns, window):
+        """Record the span from Tk construction until the first idle pass and flush"""
+        if not self.enabled:
+            return
+
+        def on_idle():
+            self.add("tk.first_frame", start_ns, time.perf_counter_ns(), window=window)
+            self.write()
+
+        root.after_idle(on_idle)
+
+    def write(self):
+        if not self.enabled:
+            return
+        path = self.path
+        if not os.path.isabs(path):
+            path = os.path.join(globals().get("application_path") or os.getcwd(), path)
+        with self.lock:
+            events = list(self.events)
+        try:
+            with open(path, "w") as f:
+                json.dump({
+                    "traceEvents": events,
+                    "displayTimeUnit": "ms",
+                    "otherData": {
+                        "argv": sys.argv,
+                        "python": sys.version,
+                        "frozen": bool(getattr(sys, 'frozen', False)),
+                    },
+                }, f)
+        except Exception:
+            pass
 
-# Try to import win32api for extended mouse support
-try:
-    import win32api
-    import win32con
-    WIN32_AVAILABLE = True
-except ImportError:
-    WIN32_AVAILABLE = False
+TRACER = StartupTracer(_trace_target())
+
+
+# ---------------------------
+# Lazy Imports
+# ---------------------------
+class _LazyModule:
+    """Module proxy that performs the real import on first attribute access"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            with TRACER.span(f"import {self._name}"):
+                self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+tk = _LazyModule("tkinter")
+messagebox = _LazyModule("tkinter.messagebox")
+keyboard = _LazyModule("keyboard")
+win32api = _LazyModule("win32api")
+win32con = _LazyModule("win32con")
+
+_win32_available = None
+
+def win32_available():
+    """Import win32api/win32con on first call for extended mouse support"""
+    global _win32_available
+    if _win32_available is None:
+        try:
+            win32api._load()
+            win32con._load()
+            _win32_available = True
+        except ImportError:
+            _win32_available = False
+    return _win32_available
 
 
 # ---------------------------
@@ -48,9 +202,6 @@ def run_as_admin():
             pass
         sys.exit()
 
-if not is_admin():
-    run_as_admin()
-
 
 if getattr(sys, 'frozen', False):
     application_path = os.path.dirname(sys.executable)
@@ -64,25 +215,52 @@ else:
 # ---------------------------
 KEY_DB_FILE = os.path.join(application_path, "keys.json")
 KEYS_REMOTE_URL = "https://raw.githubusercontent.com/D60fps/auth-data/main/keys.json"
+LICENSE_REVALIDATE_INTERVAL = 60 * 60  # seconds between remote key re-checks
+
+# What a double-edit trigger does while a previous hold is still pending:
+# "extend" pushes the release out, "restart" releases and presses again, "ignore" drops it
+DOUBLE_EDIT_RETRIGGER_POLICIES = ("extend", "restart", "ignore")
+DOUBLE_EDIT_RETRIGGER = "extend"
 
 def _load_keys():
-    """Load keys from local keys.json"""
-    if not os.path.exists(KEY_DB_FILE):
-        return {}
-    try:
-        with open(KEY_DB_FILE, "r") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+    """Load keys from local keys.json; never blocks on writers and never sees a partial file"""
+    data = read_json(KEY_DB_FILE, {})
+    return data if isinstance(data, dict) else {}
 
 def _save_keys(data):
-    """Save keys to local keys.json"""
+    """Save keys to local keys.json under the key store lock"""
     try:
-        with open(KEY_DB_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        atomic_write_json(KEY_DB_FILE, data)
     except Exception:
         pass
 
+def _key_record_problem(record, hwid):
+    """Why ``record`` does not license this machine, or None if it does"""
+    if record is None:
+        return "Invalid license key"
+
+    if record.get("revoked"):
+        return "License key has been revoked"
+
+    expires = record.get("expires")
+    if not expires:
+        return "Key has no expiry"
+
+    try:
+        exp_dt = datetime.fromisoformat(expires)
+        if exp_dt.tzinfo is None:
+            exp_dt = exp_dt.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) >= exp_dt:
+            return "License key expired"
+    except Exception:
+        return "Invalid key expiration"
+
+    stored_hwid = record.get("hwid")
+    if stored_hwid is not None and stored_hwid != hwid:
+        return "License key already used on another PC"
+    return None
+
+@TRACER.traced("sync_keys_from_github")
 def sync_keys_from_github():
     """Download latest keys.json from GitHub - with fallback"""
     try:
@@ -90,8 +268,7 @@ def sync_keys_from_github():
         with urllib.request.urlopen(KEYS_REMOTE_URL, timeout=10) as response:
             data = response.read()
 
-        with open(KEY_DB_FILE, "wb") as f:
-            f.write(data)
+        atomic_write_bytes(KEY_DB_FILE, data)
 
         print("Successfully synced keys from GitHub")
         return True
@@ -114,15 +291,159 @@ def sync_keys_from_github():
         return False
 
 
+# ---------------------------
+# Key State Table
+# ---------------------------
+class KeyStateTable:
+    """Down/up state for resolved keys, one bit per interned key ID
+
+    Transitions are check-and-set under one lock so concurrent press and
+    release calls from hook, timer and UI threads cannot both act on the
+    same key. held() walks only the set bits.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = {}
+        self._names = []
+        self._bits = 0
+
+    def key_id(self, name: str) -> int:
+        key_id = self._ids.get(name)
+        if key_id is None:
+            with self._lock:
+                key_id = self._ids.get(name)
+                if key_id is None:
+                    key_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = key_id
+        return key_id
+
+    def is_down(self, name: str) -> bool:
+        key_id = self._ids.get(name)
+        return key_id is not None and bool((self._bits >> key_id) & 1)
+
+    def claim(self, names, down: bool):
+        """Atomically move every key not already in state ``down`` into it; returns those names"""
+        masks = [(name, 1 << self.key_id(name)) for name in names]
+        changed = []
+        with self._lock:
+            bits = self._bits
+            for name, mask in masks:
+                if bool(bits & mask) != down:
+                    bits ^= mask
+                    changed.append(name)
+            self._bits = bits
+        return changed
+
+    def claim_one(self, name: str, down: bool) -> bool:
+        mask = 1 << self.key_id(name)
+        with self._lock:
+            if bool(self._bits & mask) == down:
+                return False
+            self._bits ^= mask
+        return True
+
+    def assign(self, name: str, down: bool):
+        mask = 1 << self.key_id(name)
+        with self._lock:
+            self._bits = (self._bits | mask) if down else (self._bits & ~mask)
+
+    def held(self):
+        """Names of all keys currently down"""
+        bits = self._bits
+        names = self._names
+        held = []
+        while bits:
+            low = bits & -bits
+            held.append(names[low.bit_length() - 1])
+            bits ^= low
+        return held
+
+    def as_dict(self):
+        return {name: True for name in self.held()}
+
+
 # ---------------------------
 # Mouse Controller
 # ---------------------------
+MOUSE_BUTTON_ALIASES = MappingProxyType({
+    'left': 'left', 'leftclick': 'left', 'leftmousebutton': 'left',
+    'mouse1': 'left', 'lmb': 'left', 'leftbutton': 'left', 'lmousebutton': 'left',
+    'm1': 'left', 'button1': 'left', 'mousebutton1': 'left',
+
+    'right': 'right', 'rightclick': 'right', 'rightmousebutton': 'right',
+    'mouse2': 'right', 'rmb': 'right', 'rightbutton': 'right', 'rmousebutton': 'right',
+    'm2': 'right', 'button2': 'right', 'mousebutton2': 'right',
+
+    'middle': 'middle', 'middleclick': 'middle', 'middlemousebutton': 'middle',
+    'mouse3': 'middle', 'mmb': 'middle', 'wheel': 'middle', 'middlebutton': 'middle',
+    'scrollclick': 'middle', 'wheelclick': 'middle', 'mmousebutton': 'middle',
+    'm3': 'middle', 'button3': 'middle', 'mousebutton3': 'middle',
+    'wheelbutton': 'middle', 'scrollbutton': 'middle', 'mwheel': 'middle',
+
+    'mouse4': 'mouse4', 'x1': 'mouse4', 'sidebutton1': 'mouse4',
+    'back': 'mouse4', 'backward': 'mouse4', 'xbutton1': 'mouse4',
+    'mb4': 'mouse4', 'side1': 'mouse4', 'thumb1': 'mouse4',
+    'm4': 'mouse4', 'button4': 'mouse4', 'mousebutton4': 'mouse4',
+    'xbtn1': 'mouse4', 'backbutton': 'mouse4',
+
+    'mouse5': 'mouse5', 'x2': 'mouse5', 'sidebutton2': 'mouse5',
+    'forward': 'mouse5', 'xbutton2': 'mouse5', 'mb5': 'mouse5',
+    'side2': 'mouse5', 'thumb2': 'mouse5', 'forwardbutton': 'mouse5',
+    'm5': 'mouse5', 'button5': 'mouse5', 'mousebutton5': 'mouse5',
+    'xbtn2': 'mouse5',
+
+    'mouse6': 'mouse6', 'x3': 'mouse6', 'xbutton3': 'mouse6',
+    'mb6': 'mouse6', 'sidebutton3': 'mouse6', 'm6': 'mouse6',
+    'button6': 'mouse6', 'mousebutton6': 'mouse6',
+
+    'mouse7': 'mouse7', 'x4': 'mouse7', 'xbutton4': 'mouse7',
+    'mb7': 'mouse7', 'sidebutton4': 'mouse7', 'm7': 'mouse7',
+    'button7': 'mouse7', 'mousebutton7': 'mouse7',
+
+    'mouse8': 'mouse8', 'x5': 'mouse8', 'xbutton5': 'mouse8',
+    'mb8': 'mouse8', 'sidebutton5': 'mouse8', 'm8': 'mouse8',
+    'button8': 'mouse8', 'mousebutton8': 'mouse8',
+
+    'mouse9': 'mouse9', 'x6': 'mouse9', 'xbutton6': 'mouse9',
+    'mb9': 'mouse9', 'sidebutton6': 'mouse9', 'm9': 'mouse9',
+    'button9': 'mouse9', 'mousebutton9': 'mouse9',
+
+    'mouse10': 'mouse10', 'x7': 'mouse10', 'xbutton7': 'mouse10',
+    'mb10': 'mouse10', 'sidebutton7': 'mouse10', 'm10': 'mouse10',
+    'button10': 'mouse10', 'mousebutton10': 'mouse10',
+})
+
+STANDARD_BUTTONS = frozenset(('left', 'right', 'middle'))
+XBUTTONS = frozenset(('mouse4', 'mouse5'))
+EXTRA_BUTTON_CODES = MappingProxyType({
+    'mouse6': 7,
+    'mouse7': 8,
+    'mouse8': 9,
+    'mouse9': 10,
+    'mouse10': 11,
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_button_name(button_name: str) -> str:
+    """Map any supported spelling of a mouse button to its canonical name ("" if unknown)"""
+    if not button_name:
+        return ""
+    name = button_name.lower().strip().replace(' ', '').replace('_', '').replace('-', '')
+    return MOUSE_BUTTON_ALIASES.get(name, "")
+
+
 class AXISMouseController:
     def __init__(self):
         self.pynput_available = False
         self.controller = None
         self.button_class = None
-        self.states = {}
+        self.states = KeyStateTable()
+        self._inject_lock = threading.Lock()
+        self.buttons = MappingProxyType({})
+        self._resolved = {}
+        self._xbutton_events = None
         self._init_pynput()
 
     def _init_pynput(self):
@@ -141,190 +462,330 @@ class AXISMouseController:
                 x_button1 = 5
                 x_button2 = 6
             self.button_class = FallbackButton
+        self.buttons = self._build_button_table()
+
+    def _build_button_table(self):
+        """Resolve every canonical button name to its backend button object once"""
+        cls = self.button_class
+        table = {
+            'left': cls.left,
+            'right': cls.right,
+            'middle': cls.middle,
+            'mouse4': getattr(cls, 'x1', getattr(cls, 'x_button1', 5)),
+            'mouse5': getattr(cls, 'x2', getattr(cls, 'x_button2', 6)),
+        }
+        table.update(EXTRA_BUTTON_CODES)
+        return MappingProxyType(table)
+
+    def _xbutton_table(self):
+        """Build the win32 X-button event table on first use"""
+        if self._xbutton_events is None:
+            xbutton1 = getattr(win32con, 'XBUTTON1', 1)
+            xbutton2 = getattr(win32con, 'XBUTTON2', 2)
+            down = getattr(win32con, 'MOUSEEVENTF_XDOWN', 0x0100)
+            up = getattr(win32con, 'MOUSEEVENTF_XUP', 0x0101)
+            self._xbutton_events = MappingProxyType({
+                'mouse4': (down, up, xbutton1),
+                'mouse5': (down, up, xbutton2),
+            })
+        return self._xbutton_events
+
+    def resolve(self, button_name: str):
+        """Return (canonical name, backend button) for a configured name, cached per name"""
+        resolved = self._resolved.get(button_name)
+        if resolved is None:
+            normalized = _normalize_button_name(button_name)
+            resolved = (normalized, self.buttons.get(normalized) if normalized else None)
+            if len(self._resolved) >= 256:
+                self._resolved.clear()
+            self._resolved[button_name] = resolved
+        return resolved
+
+    def equivalent_buttons(self, button_name: str) -> frozenset:
+        """Return every backend button object that denotes the same physical button"""
+        normalized, button = self.resolve(button_name)
+        if button is None:
+            return frozenset()
+        equivalents = {button}
+        for attr in dir(self.button_class):
+            if attr.startswith('_') or _normalize_button_name(attr) != normalized:
+                continue
+            value = getattr(self.button_class, attr, None)
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            if value is not None:
+                equivalents.add(value)
+        return frozenset(equivalents)
 
     def normalize_button_name(self, button_name: str) -> str:
-        if not button_name:
-            return ""
-        
-        name = button_name.lower().strip().replace(' ', '').replace('_', '').replace('-', '')
-        
-        button_map = {
-            'left': 'left', 'leftclick': 'left', 'leftmousebutton': 'left', 
-            'mouse1': 'left', 'lmb': 'left', 'leftbutton': 'left', 'lmousebutton': 'left',
-            'm1': 'left', 'button1': 'left', 'mousebutton1': 'left',
-            
-            'right': 'right', 'rightclick': 'right', 'rightmousebutton': 'right', 
-            'mouse2': 'right', 'rmb': 'right', 'rightbutton': 'right', 'rmousebutton': 'right',
-            'm2': 'right', 'button2': 'right', 'mousebutton2': 'right',
-            
-            'middle': 'middle', 'middleclick': 'middle', 'middlemousebutton': 'middle', 
-            'mouse3': 'middle', 'mmb': 'middle', 'wheel': 'middle', 'middlebutton': 'middle',
-            'scrollclick': 'middle', 'wheelclick': 'middle', 'mmousebutton': 'middle',
-            'm3': 'middle', 'button3': 'middle', 'mousebutton3': 'middle',
-            'wheelbutton': 'middle', 'scrollbutton': 'middle', 'mwheel': 'middle',
-            
-            'mouse4': 'mouse4', 'x1': 'mouse4', 'sidebutton1': 'mouse4', 
-            'back': 'mouse4', 'backward': 'mouse4', 'xbutton1': 'mouse4',
-            'mb4': 'mouse4', 'side1': 'mouse4', 'thumb1': 'mouse4',
-            'm4': 'mouse4', 'button4': 'mouse4', 'mousebutton4': 'mouse4',
-            'xbtn1': 'mouse4', 'backbutton': 'mouse4',
-            
-            'mouse5': 'mouse5', 'x2': 'mouse5', 'sidebutton2': 'mouse5', 
-            'forward': 'mouse5', 'xbutton2': 'mouse5', 'mb5': 'mouse5',
-            'side2': 'mouse5', 'thumb2': 'mouse5', 'forwardbutton': 'mouse5',
-            'm5': 'mouse5', 'button5': 'mouse5', 'mousebutton5': 'mouse5',
-            'xbtn2': 'mouse5',
-            
-            'mouse6': 'mouse6', 'x3': 'mouse6', 'xbutton3': 'mouse6', 
-            'mb6': 'mouse6', 'sidebutton3': 'mouse6', 'm6': 'mouse6',
-            'button6': 'mouse6', 'mousebutton6': 'mouse6',
-            
-            'mouse7': 'mouse7', 'x4': 'mouse7', 'xbutton4': 'mouse7', 
-            'mb7': 'mouse7', 'sidebutton4': 'mouse7', 'm7': 'mouse7',
-            'button7': 'mouse7', 'mousebutton7': 'mouse7',
-            
-            'mouse8': 'mouse8', 'x5': 'mouse8', 'xbutton5': 'mouse8', 
-            'mb8': 'mouse8', 'sidebutton5': 'mouse8', 'm8': 'mouse8',
-            'button8': 'mouse8', 'mousebutton8': 'mouse8',
-            
-            'mouse9': 'mouse9', 'x6': 'mouse9', 'xbutton6': 'mouse9', 
-            'mb9': 'mouse9', 'sidebutton6': 'mouse9', 'm9': 'mouse9',
-            'button9': 'mouse9', 'mousebutton9': 'mouse9',
-            
-            'mouse10': 'mouse10', 'x7': 'mouse10', 'xbutton7': 'mouse10', 
-            'mb10': 'mouse10', 'sidebutton7': 'mouse10', 'm10': 'mouse10',
-            'button10': 'mouse10', 'mousebutton10': 'mouse10',
-        }
-        
-        return button_map.get(name, "")
-    
+        return _normalize_button_name(button_name) if button_name else ""
+
     def get_button(self, button_name: str):
         if not self.button_class:
             return None
-        
-        normalized = self.normalize_button_name(button_name)
-        
-        button_map = {
-            'left': self.button_class.left,
-            'right': self.button_class.right,
-            'middle': self.button_class.middle,
-            'mouse4': getattr(self.button_class, 'x1', getattr(self.button_class, 'x_button1', 5)),
-            'mouse5': getattr(self.button_class, 'x2', getattr(self.button_class, 'x_button2', 6)),
-            'mouse6': 7,
-            'mouse7': 8,
-            'mouse8': 9,
-            'mouse9': 10,
-            'mouse10': 11,
-        }
-        
-        return button_map.get(normalized)
-    
-    def press(self, button_name: str) -> bool:
-        normalized = self.normalize_button_name(button_name)
-        if not normalized:
-            return False
-            
-        if self.states.get(normalized):
-            return True
+        return self.resolve(button_name)[1]
 
-        button = self.get_button(button_name)
-        if button is None:
+    def _inject(self, normalized, button, down: bool) -> bool:
+        """Send one button transition through pynput, or win32 for the X buttons"""
+        if not (self.pynput_available and self.controller):
             return False
-
         try:
-            if self.pynput_available and self.controller:
-                if normalized in ['left', 'right', 'middle']:
-                    self.controller.press(button)
-                    self.states[normalized] = True
-                    return True
-                elif normalized in ['mouse4', 'mouse5'] and WIN32_AVAILABLE:
-                    try:
-                        XBUTTON1 = getattr(win32con, 'XBUTTON1', 1)
-                        XBUTTON2 = getattr(win32con, 'XBUTTON2', 2)
-                        MOUSEEVENTF_XDOWN = getattr(win32con, 'MOUSEEVENTF_XDOWN', 0x0100)
-                        
-                        button_events = {
-                            'mouse4': (MOUSEEVENTF_XDOWN, XBUTTON1),
-                            'mouse5': (MOUSEEVENTF_XDOWN, XBUTTON2),
-                        }
-                        
-                        if normalized in button_events:
-                            event, xbutton = button_events[normalized]
-                            pos = win32api.GetCursorPos()
-                            win32api.mouse_event(event, pos[0], pos[1], xbutton, 0)
-                            self.states[normalized] = True
-                            return True
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        self.controller.press(button)
-                        self.states[normalized] = True
-                        return True
-                    except Exception:
-                        pass
-            
-            return False
+            if normalized in XBUTTONS and win32_available():
+                down_event, up_event, xbutton = self._xbutton_table()[normalized]
+                pos = win32api.GetCursorPos()
+                win32api.mouse_event(down_event if down else up_event, pos[0], pos[1], xbutton, 0)
+            elif down:
+                self.controller.press(button)
+            else:
+                self.controller.release(button)
+            return True
         except Exception:
             return False
 
-    def release(self, button_name: str) -> bool:
-        normalized = self.normalize_button_name(button_name)
+    def _transition(self, button_name: str, down: bool) -> bool:
+        normalized, button = self.resolve(button_name)
         if not normalized:
             return False
-            
-        if not self.states.get(normalized):
+
+        with self._inject_lock:
+            if not self.states.claim_one(normalized, down):
+                return True
+            if button is None or not self._inject(normalized, button, down):
+                self.states.assign(normalized, not down)
+                return False
             return True
 
-        button = self.get_button(button_name)
-        if button is None:
+    def press(self, button_name: str) -> bool:
+        return self._transition(button_name, True)
+
+    def release(self, button_name: str) -> bool:
+        return self._transition(button_name, False)
+
+    def release_all(self):
+        for btn in self.states.held():
+            try:
+                self.release(btn)
+            except Exception:
+                pass
+
+_mouse_controller = None
+_subsystem_lock = threading.RLock()  # re-entrant: some subsystems create others in their constructor
+
+def get_mouse_controller():
+    """Return the shared mouse controller, creating it on first use"""
+    global _mouse_controller
+    if _mouse_controller is None:
+        with _subsystem_lock:
+            if _mouse_controller is None:
+                _mouse_controller = AXISMouseController()
+    return _mouse_controller
+
+
+# ---------------------------
+# Input Backends
+# ---------------------------
+INPUT_BACKEND_ENV_VAR = "AXIS_INPUT_BACKEND"
+KIND_MOUSE = "mouse"
+KIND_KEYBOARD = "keyboard"
+
+
+class KeyDescriptor(NamedTuple):
+    """Resolved identity of a configured key"""
+    kind: str   # KIND_MOUSE or KIND_KEYBOARD
+    name: str   # canonical mouse button name or normalized keyboard key name
+    code: object  # keyboard scan code (or name when it has none); button name for mice
+    codes: tuple  # every code input events may report for the key, e.g. both scan codes of a numpad key
+
+
+class InputAction(NamedTuple):
+    """One key or button transition submitted to an input backend"""
+    desc: KeyDescriptor
+    down: bool
+
+
+class InputBackend:
+    """Injects batches of InputActions; a batch should reach the OS as one unit where possible
+
+    ``submit`` returns False only when no press of the batch is left held.
+    """
+    name = "base"
+
+    def submit(self, actions) -> bool:
+        raise NotImplementedError
+
+
+class RecordingBackend(InputBackend):
+    """In-memory backend that records every batch; needs no devices, works on any OS"""
+    name = "recording"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.batches = []
+
+    def submit(self, actions) -> bool:
+        batch = tuple(actions)
+        with self.lock:
+            self.batches.append((time.perf_counter_ns(), batch))
+        return True
+
+    @property
+    def actions(self):
+        with self.lock:
+            return [action for _, batch in self.batches for action in batch]
+
+    def clear(self):
+        with self.lock:
+            self.batches.clear()
+
+
+# SendInput constants (winuser.h)
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_SCANCODE = 0x0008
+SENDINPUT_MOUSE_FLAGS = MappingProxyType({
+    'left': (0x0002, 0x0004, 0),
+    'right': (0x0008, 0x0010, 0),
+    'middle': (0x0020, 0x0040, 0),
+    'mouse4': (0x0080, 0x0100, 1),
+    'mouse5': (0x0080, 0x0100, 2),
+})
+
+
+class NativeInputBackend(InputBackend):
+    """Injects through one SendInput call per batch on Windows, else action by action
+
+    Batches are sent atomically when every action can be expressed as an
+    INPUT record (left/right/middle/X buttons and plain keyboard scan
+    codes). Anything else falls back to the mouse controller (pynput/win32)
+    and the keyboard module one action at a time.
+    """
+    name = "native"
+
+    def __init__(self):
+        self._send_input = None
+        self._input_type = None
+        self._sendinput_checked = False
+
+    def _load_sendinput(self):
+        if not self._sendinput_checked:
+            self._sendinput_checked = True
+            try:
+                send_input = ctypes.windll.user32.SendInput
+            except Exception:
+                return None
+            ulong_ptr = ctypes.c_size_t
+
+            class MOUSEINPUT(ctypes.Structure):
+                _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                            ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ulong_ptr)]
+
+            class KEYBDINPUT(ctypes.Structure):
+                _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                            ("time", ctypes.c_ulong), ("dwExtraInfo", ulong_ptr)]
+
+            class HARDWAREINPUT(ctypes.Structure):
+                _fields_ = [("uMsg", ctypes.c_ulong), ("wParamL", ctypes.c_ushort), ("wParamH", ctypes.c_ushort)]
+
+            class INPUTUNION(ctypes.Union):
+                _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+            class INPUT(ctypes.Structure):
+                _fields_ = [("type", ctypes.c_ulong), ("u", INPUTUNION)]
+
+            self._input_type = INPUT
+            self._send_input = send_input
+        return self._send_input
+
+    def _encode(self, record, action):
+        desc = action.desc
+        if desc.kind == KIND_MOUSE:
+            flags = SENDINPUT_MOUSE_FLAGS.get(desc.name)
+            if flags is None:
+                return False
+            record.type = INPUT_MOUSE
+            record.u.mi.dwFlags = flags[0] if action.down else flags[1]
+            record.u.mi.mouseData = flags[2]
+            return True
+        if not isinstance(desc.code, int) or not 0 < desc.code < 0x80:
             return False
+        record.type = INPUT_KEYBOARD
+        record.u.ki.wScan = desc.code
+        record.u.ki.dwFlags = KEYEVENTF_SCANCODE | (0 if action.down else KEYEVENTF_KEYUP)
+        return True
 
-        try:
-            if self.pynput_available and self.controller:
-                if normalized in ['left', 'right', 'middle']:
-                    self.controller.release(button)
-                    self.states[normalized] = False
-                    return True
-                elif normalized in ['mouse4', 'mouse5'] and WIN32_AVAILABLE:
-                    try:
-                        XBUTTON1 = getattr(win32con, 'XBUTTON1', 1)
-                        XBUTTON2 = getattr(win32con, 'XBUTTON2', 2)
-                        MOUSEEVENTF_XUP = getattr(win32con, 'MOUSEEVENTF_XUP', 0x0101)
-                        button_events = {
-                            'mouse4': (MOUSEEVENTF_XUP, XBUTTON1),
-                            'mouse5': (MOUSEEVENTF_XUP, XBUTTON2),
-                        }
-                        
-                        if normalized in button_events:
-                            event, xbutton = button_events[normalized]
-                            pos = win32api.GetCursorPos()
-                            win32api.mouse_event(event, pos[0], pos[1], xbutton, 0)
-                            self.states[normalized] = False
-                            return True
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        self.controller.release(button)
-                        self.states[normalized] = False
-                        return True
-                    except Exception:
-                        pass
-            
+    def _submit_batched(self, actions) -> bool:
+        send_input = self._load_sendinput()
+        if send_input is None:
             return False
+        records = (self._input_type * len(actions))()
+        for record, action in zip(records, actions):
+            if not self._encode(record, action):
+                return False
+        sent = send_input(len(actions), records, ctypes.sizeof(self._input_type))
+        if sent != len(actions):
+            return False
+        controller = _mouse_controller
+        if controller is not None:
+            for action in actions:
+                if action.desc.kind == KIND_MOUSE:
+                    controller.states.assign(action.desc.name, action.down)
+        return True
+
+    def _submit_one(self, desc, down: bool) -> bool:
+        try:
+            if desc.kind == KIND_MOUSE:
+                controller = get_mouse_controller()
+                return controller.press(desc.name) if down else controller.release(desc.name)
+            if down:
+                keyboard.press(desc.code)
+            else:
+                keyboard.release(desc.code)
+            return True
         except Exception:
             return False
 
-    def release_all(self):
-        for btn in list(self.states.keys()):
-            if self.states.get(btn):
-                try:
-                    self.release(btn)
-                except Exception:
-                    pass
+    def submit(self, actions) -> bool:
+        if len(actions) > 1 and self._submit_batched(actions):
+            return True
+        injected = []
+        success = True
+        for action in actions:
+            if self._submit_one(action.desc, action.down):
+                injected.append(action)
+            else:
+                success = False
+        if not success:
+            # the caller rolls back the state of every key in a failed batch, so
+            # undo the presses that did go out rather than leave them held untracked
+            for action in reversed(injected):
+                if action.down:
+                    self._submit_one(action.desc, False)
+        return success
+
+
+_input_backend = None
+
+def get_input_backend():
+    """Return the active input backend (native unless AXIS_INPUT_BACKEND=recording)"""
+    global _input_backend
+    if _input_backend is None:
+        with _subsystem_lock:
+            if _input_backend is None:
+                if os.environ.get(INPUT_BACKEND_ENV_VAR, "").strip().lower() == "recording":
+                    _input_backend = RecordingBackend()
+                else:
+                    _input_backend = NativeInputBackend()
+    return _input_backend
 
-mouse_controller = AXISMouseController()
+def set_input_backend(backend: InputBackend):
+    """Swap the input backend, e.g. for a RecordingBackend in tests and benchmarks"""
+    global _input_backend
+    _input_backend = backend
+    if _key_manager is not None:
+        _key_manager.backend = backend
 
 
 # ---------------------------
@@ -332,175 +793,803 @@ mouse_controller = AXISMouseController()
 # ---------------------------
 class AXISKeyManager:
     def __init__(self):
-        self.key_states = {}
-        self.mouse_keywords = {
-            'mouse', 'left', 'right', 'middle', 'click', 'lmb', 'rmb', 'mmb',
-            'x1', 'x2', 'x3', 'x4', 'x5', 'x6', 'x7', 'xbtn', 'xbutton',
-            'back', 'forward', 'side', 'thumb', 'button',
-            'mouse1', 'mouse2', 'mouse3', 'mouse4', 'mouse5', 
-            'mouse6', 'mouse7', 'mouse8', 'mouse9', 'mouse10',
-            'wheel', 'scroll', 'mb', 'm1', 'm2', 'm3', 'm4', 'm5',
-            'm6', 'm7', 'm8', 'm9', 'm10', 'mwheel'
-        }
-    
+        self.states = KeyStateTable()
+        self._inject_lock = threading.Lock()
+        self._descriptors = {}
+        self.backend = get_input_backend()
+
+    def _describe(self, key: str):
+        button = _normalize_button_name(key)
+        if button:
+            return KeyDescriptor(KIND_MOUSE, button, button, (button,))
+
+        name = self.normalize_key(key)
+        if not name:
+            return None
+        codes = (name,)
+        try:
+            scan_codes = keyboard.key_to_scan_codes(name)
+            if scan_codes:
+                codes = tuple(dict.fromkeys(scan_codes))
+        except Exception:
+            pass
+        return KeyDescriptor(KIND_KEYBOARD, name, codes[0], codes)
+
+    def resolve(self, key: str):
+        """Return the cached KeyDescriptor for a configured key (None if empty)"""
+        desc = self._descriptors.get(key)
+        if desc is None and key:
+            desc = self._describe(key)
+            if desc is not None:
+                if len(self._descriptors) >= 256:
+                    self._descriptors.clear()
+                self._descriptors[key] = desc
+        return desc
+
     def is_mouse_button(self, key: str) -> bool:
-        if not key:
-            return False
-        key_lower = key.lower().strip()
-        return any(keyword in key_lower for keyword in self.mouse_keywords)
-    
+        desc = self.resolve(key)
+        return desc is not None and desc.kind == KIND_MOUSE
+
     def normalize_key(self, key: str) -> str:
         if not key:
             return ""
         return key.lower().strip()
-    
+
+    @property
+    def key_states(self):
+        return self.states.as_dict()
+
+    def _transition(self, keys, down: bool) -> bool:
+        """Submit every key not already in the requested state as one backend batch"""
+        descs = {}
+        for key in keys:
+            desc = self.resolve(key)
+            if desc is None:
+                return False
+            descs[desc.name] = desc
+
+        # The lock spans claim and submit so a concurrent opposite transition
+        # can never reach the backend ahead of the one that claimed first
+        with self._inject_lock:
+            changed = self.states.claim(descs, down)
+            if not changed:
+                return True
+            try:
+                if LATENCY.enabled:
+                    LATENCY.mark_backend_start()
+                success = self.backend.submit([InputAction(descs[name], down) for name in changed])
+                if LATENCY.enabled:
+                    LATENCY.mark(STAGE_BACKEND_RETURN)
+            except Exception:
+                success = False
+            if not success:
+                self.states.claim(changed, not down)
+            return success
+
     def press(self, key: str) -> bool:
-        if not key:
+        return self._transition((key,), True)
+
+    def release(self, key: str) -> bool:
+        return self._transition((key,), False)
+
+    def press_many(self, keys) -> bool:
+        """Press several keys in one backend submission (e.g. a chord)"""
+        return self._transition(keys, True)
+
+    def release_many(self, keys) -> bool:
+        """Release several keys in one backend submission"""
+        return self._transition(keys, False)
+
+    def is_pressed(self, key: str) -> bool:
+        desc = self.resolve(key)
+        if desc is None or desc.kind == KIND_MOUSE:
             return False
-        
-        normalized = self.normalize_key(key)
-        if self.key_states.get(normalized):
-            return True
-        
         try:
-            if self.is_mouse_button(key):
-                success = mouse_controller.press(key)
-            else:
-                keyboard.press(key)
-                success = True
-            
-            if success:
-                self.key_states[normalized] = True
-            return success
+            return keyboard.is_pressed(desc.code)
         except Exception:
             return False
-    
-    def release(self, key: str) -> bool:
-        if not key:
-            return False
-        
-        normalized = self.normalize_key(key)
-        if not self.key_states.get(normalized):
-            return True
-        
+
+    def release_all(self):
+        held = self.states.held()
+        if held:
+            try:
+                self.release_many(held)
+            except Exception:
+                pass
+        if _mouse_controller is not None:
+            _mouse_controller.release_all()
+
+_key_manager = None
+
+def get_key_manager():
+    """Return the shared key manager, creating it on first use"""
+    global _key_manager
+    if _key_manager is None:
+        with _subsystem_lock:
+            if _key_manager is None:
+                _key_manager = AXISKeyManager()
+    return _key_manager
+
+
+# ---------------------------
+# Latency Instrumentation
+# ---------------------------
+LATENCY_ENV_VAR = "AXIS_LATENCY"
+LATENCY_CAPACITY = 8192
+LATENCY_STAGES = ("hook", "dispatch", "backend_start", "backend_return")
+STAGE_HOOK, STAGE_DISPATCH, STAGE_BACKEND_START, STAGE_BACKEND_RETURN = range(4)
+
+
+class LatencyProbe:
+    """Ring buffer of per-event stage timestamps from hook entry to injection return
+
+    Each slot holds four perf_counter_ns() stamps. The slot of the event
+    being handled is tracked per thread so backend calls made from the hook
+    callback land on the right event. While disabled every probe point is a
+    single attribute check.
+    """
+    def __init__(self, capacity=LATENCY_CAPACITY):
+        self.enabled = False
+        self.capacity = capacity
+        self.stamps = array.array('q', bytes(8 * len(LATENCY_STAGES) * capacity))
+        self._counter = itertools.count()
+        self._local = threading.local()
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = bool(enabled)
+
+    def begin(self):
+        """Start a new event at hook entry"""
+        base = (next(self._counter) % self.capacity) * 4
+        stamps = self.stamps
+        stamps[base] = time.perf_counter_ns()
+        stamps[base + 1] = stamps[base + 2] = stamps[base + 3] = 0
+        self._local.base = base
+
+    def mark(self, stage: int):
+        base = getattr(self._local, 'base', None)
+        if base is not None:
+            self.stamps[base + stage] = time.perf_counter_ns()
+
+    def mark_backend_start(self):
+        base = getattr(self._local, 'base', None)
+        if base is not None and not self.stamps[base + STAGE_BACKEND_START]:
+            self.stamps[base + STAGE_BACKEND_START] = time.perf_counter_ns()
+
+    def reset(self):
+        self.stamps = array.array('q', bytes(8 * len(LATENCY_STAGES) * self.capacity))
+        self._counter = itertools.count()
+
+    def histograms(self):
+        """Return log2-microsecond histograms for each stage-to-stage segment"""
+        segments = {
+            "hook->dispatch": (STAGE_HOOK, STAGE_DISPATCH),
+            "dispatch->backend_start": (STAGE_DISPATCH, STAGE_BACKEND_START),
+            "backend_start->backend_return": (STAGE_BACKEND_START, STAGE_BACKEND_RETURN),
+            "hook->backend_return": (STAGE_HOOK, STAGE_BACKEND_RETURN),
+        }
+        stamps = self.stamps
+        report = {}
+        for name, (first, last) in segments.items():
+            buckets = {}
+            values = []
+            for base in range(0, len(stamps), 4):
+                start, end = stamps[base + first], stamps[base + last]
+                if not start or not end or end < start:
+                    continue
+                micros = (end - start) / 1000.0
+                values.append(micros)
+                upper = 1
+                while upper < micros:
+                    upper <<= 1
+                label = f"<={upper}us"
+                buckets[label] = buckets.get(label, 0) + 1
+            values.sort()
+            report[name] = {
+                "count": len(values),
+                "p50_us": values[len(values) // 2] if values else None,
+                "max_us": values[-1] if values else None,
+                "buckets": dict(sorted(buckets.items(), key=lambda item: int(item[0][2:-2]))),
+            }
+        return report
+
+    def dump(self, path=None):
+        """Print the histograms and optionally write them as JSON"""
+        report = self.histograms()
+        for name, data in report.items():
+            print(f"Latency {name}: n={data['count']} p50={data['p50_us']} us max={data['max_us']} us")
+            for label, count in data["buckets"].items():
+                print(f"  {label:>10} {count}")
+        if path:
+            try:
+                with open(path, "w") as f:
+                    json.dump(report, f, indent=4)
+            except Exception:
+                pass
+        return report
+
+LATENCY = LatencyProbe()
+LATENCY.set_enabled(os.environ.get(LATENCY_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on"))
+
+
+# ---------------------------
+# Input Hook Service
+# ---------------------------
+class InputHookService:
+    """Owns the single process-wide mouse and keyboard hooks and dispatches events by key"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._registrations = {}
+        self._next_token = 1
+        # (mouse table, keyboard table) of key -> tuple of callbacks, replaced with a single
+        # assignment so hook threads never see a partial or mixed set of bindings
+        self._tables = (MappingProxyType({}), MappingProxyType({}))
+        self._mouse_listener = None
+        self._keyboard_hook = None
+
+    def register(self, device, keys, callback: Callable) -> int:
+        """Call ``callback(pressed)`` for every down/up of any of ``keys`` on ``device``; returns a token"""
+        return self.replace((), [(device, keys, callback)])[0]
+
+    def register_mouse(self, buttons, callback: Callable) -> int:
+        return self.register(KIND_MOUSE, buttons, callback)
+
+    def register_key(self, desc: KeyDescriptor, callback: Callable) -> int:
+        return self.register(KIND_KEYBOARD, desc.codes, callback)
+
+    def replace(self, old_tokens, bindings):
+        """Unregister ``old_tokens`` and register ``bindings`` in one dispatch table swap
+
+        Events are delivered either entirely by the old bindings or entirely
+        by the new ones, and hooks needed by both stay installed throughout.
+        Returns the new tokens in the order of ``bindings``.
+        """
+        with self._lock:
+            for token in old_tokens:
+                if token is not None:
+                    self._registrations.pop(token, None)
+            tokens = []
+            for device, keys, callback in bindings:
+                token = self._next_token
+                self._next_token += 1
+                self._registrations[token] = (device, frozenset(keys), callback)
+                tokens.append(token)
+            self._rebuild()
+            self._sync_hooks()
+        return tokens
+
+    def unregister(self, token: int):
+        self.replace((token,), ())
+
+    def _sync_hooks(self):
+        """Install or remove OS hooks so exactly the devices in use are hooked"""
+        devices = {device for device, _, _ in self._registrations.values()}
+        if KIND_MOUSE in devices:
+            self._ensure_mouse_listener()
+        else:
+            self._stop_mouse_listener()
+        if KIND_KEYBOARD in devices:
+            self._ensure_keyboard_hook()
+        else:
+            self._stop_keyboard_hook()
+
+    def _rebuild(self):
+        tables = {KIND_MOUSE: {}, KIND_KEYBOARD: {}}
+        for device, keys, callback in self._registrations.values():
+            table = tables[device]
+            for key in keys:
+                table[key] = table.get(key, ()) + (callback,)
+        self._tables = (MappingProxyType(tables[KIND_MOUSE]), MappingProxyType(tables[KIND_KEYBOARD]))
+
+    def _ensure_mouse_listener(self):
+        if self._mouse_listener is not None or not get_mouse_controller().pynput_available:
+            return
         try:
-            if self.is_mouse_button(key):
-                success = mouse_controller.release(key)
-            else:
-                keyboard.release(key)
-                success = True
-            
-            if success:
-                self.key_states[normalized] = False
-            return success
+            from pynput.mouse import Listener
+            listener = Listener(on_click=self._on_click)
+            listener.daemon = True
+            listener.start()
+            self._mouse_listener = listener
         except Exception:
-            return False
-    
-    def is_pressed(self, key: str) -> bool:
-        if not key or self.is_mouse_button(key):
-            return False
+            self._mouse_listener = None
+
+    def _stop_mouse_listener(self):
+        listener, self._mouse_listener = self._mouse_listener, None
+        if listener is not None:
+            try:
+                listener.stop()
+            except Exception:
+                pass
+
+    def _ensure_keyboard_hook(self):
+        if self._keyboard_hook is not None:
+            return
         try:
-            return keyboard.is_pressed(key)
+            self._keyboard_hook = keyboard.hook(self._on_key)
         except Exception:
-            return False
-    
-    def release_all(self):
-        for key in list(self.key_states.keys()):
-            if self.key_states.get(key):
+            self._keyboard_hook = None
+
+    def _stop_keyboard_hook(self):
+        hook, self._keyboard_hook = self._keyboard_hook, None
+        if hook is not None:
+            try:
+                keyboard.unhook(hook)
+            except Exception:
+                pass
+
+    def _on_click(self, x, y, btn, pressed):
+        if LATENCY.enabled:
+            LATENCY.begin()
+        callbacks = self._tables[0].get(btn)
+        if callbacks is None:
+            return
+        if LATENCY.enabled:
+            LATENCY.mark(STAGE_DISPATCH)
+        for callback in callbacks:
+            try:
+                callback(pressed)
+            except Exception:
+                pass
+
+    def _on_key(self, event):
+        if LATENCY.enabled:
+            LATENCY.begin()
+        table = self._tables[1]
+        callbacks = table.get(event.scan_code)
+        if callbacks is None:
+            callbacks = table.get(event.name)
+            if callbacks is None:
+                return
+        if LATENCY.enabled:
+            LATENCY.mark(STAGE_DISPATCH)
+        pressed = event.event_type == "down"
+        for callback in callbacks:
+            try:
+                callback(pressed)
+            except Exception:
+                pass
+
+    def stop(self):
+        with self._lock:
+            self._registrations.clear()
+            self._rebuild()
+            self._stop_mouse_listener()
+            self._stop_keyboard_hook()
+
+_input_hooks = None
+
+def get_input_hooks():
+    """Return the shared input hook service, creating it on first use"""
+    global _input_hooks
+    if _input_hooks is None:
+        with _subsystem_lock:
+            if _input_hooks is None:
+                _input_hooks = InputHookService()
+    return _input_hooks
+
+
+# ---------------------------
+# Mouse Listener
+# ---------------------------
+class AXISMouseListener:
+    def __init__(self, button_name: str, on_press: Callable, on_release: Callable):
+        self.button_name = button_name
+        self.on_press_callback = on_press
+        self.on_release_callback = on_release
+        self.token = None
+        self.running = False
+        self.is_pressed = False
+        self.press_lock = threading.Lock()
+
+    def start(self):
+        if self.running:
+            return
+
+        binding = self.prepare()
+        if binding is None:
+            return
+        self.activate(get_input_hooks().register(*binding))
+
+    def prepare(self):
+        """Resolve the trigger into a (device, keys, callback) binding without registering it"""
+        buttons = get_mouse_controller().equivalent_buttons(self.button_name)
+        if not buttons:
+            return None
+        return (KIND_MOUSE, buttons, self._on_button)
+
+    def activate(self, token: int):
+        """Mark the listener live once its binding has been registered under ``token``"""
+        self.is_pressed = False
+        self.token = token
+        self.running = True
+
+    def _on_button(self, pressed):
+        if not self.running:
+            return
+        with self.press_lock:
+            try:
+                if pressed and not self.is_pressed:
+                    self.is_pressed = True
+                    self.on_press_callback()
+                elif not pressed and self.is_pressed:
+                    self.is_pressed = False
+                    self.on_release_callback()
+            except Exception:
+                pass
+
+    def stop(self):
+        self.running = False
+        self.is_pressed = False
+        token, self.token = self.token, None
+        if token is not None:
+            try:
+                get_input_hooks().unregister(token)
+            except Exception:
+                pass
+
+
+class AXISKeyListener(AXISMouseListener):
+    """Trigger listener for keyboard keys, dispatched from the shared keyboard hook"""
+    def prepare(self):
+        desc = get_key_manager().resolve(self.button_name)
+        if desc is None or desc.kind != KIND_KEYBOARD:
+            return None
+        return (KIND_KEYBOARD, desc.codes, self._on_button)
+
+
+def create_trigger_listener(key: str, on_press: Callable, on_release: Callable):
+    """Return a mouse or keyboard trigger listener depending on what ``key`` resolves to"""
+    if get_key_manager().is_mouse_button(key):
+        return AXISMouseListener(key, on_press, on_release)
+    return AXISKeyListener(key, on_press, on_release)
+
+
+# ---------------------------
+# Timer Scheduler
+# ---------------------------
+TIMER_SPIN_NS = 2_000_000  # final stretch before a deadline that is spun instead of slept
+JITTER_SAMPLES = 4096      # lateness samples kept per macro
+
+
+class JitterStats:
+    """Bounded record of how late scheduled actions fired, in nanoseconds"""
+    def __init__(self, maxlen=JITTER_SAMPLES):
+        self.samples = collections.deque(maxlen=maxlen)
+        self.count = 0
+
+    def record(self, lateness_ns):
+        self.samples.append(lateness_ns)
+        self.count += 1
+
+    def percentiles(self):
+        """Return p50/p99/max lateness in microseconds over the retained samples"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"count": 0, "p50_us": None, "p99_us": None, "max_us": None}
+
+        def pick(q):
+            return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1) + 0.5))] / 1000.0
+
+        return {
+            "count": self.count,
+            "p50_us": pick(0.50),
+            "p99_us": pick(0.99),
+            "max_us": ordered[-1] / 1000.0,
+        }
+
+
+class ScheduledAction:
+    """Handle for a callback queued on the TimerScheduler"""
+    __slots__ = ("deadline", "callback", "args", "tag", "cancelled", "fired")
+
+    def __init__(self, deadline, callback, args, tag):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.tag = tag
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def pending(self):
+        return not (self.cancelled or self.fired)
+
+
+class TimerScheduler:
+    """Runs delayed callbacks on one worker thread, ordered by a perf_counter_ns heap
+
+    The worker sleeps on a condition until TIMER_SPIN_NS before the next
+    deadline and spins for the remainder, so actions fire well below the
+    default ~15.6 ms Windows sleep granularity. Lateness of every action is
+    recorded per tag.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []
+        self._seq = itertools.count()
+        self._thread = None
+        self._running = False
+        self._jitter = {}
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="axis-timers", daemon=True)
+            self._thread.start()
+
+    def schedule(self, delay: float, callback: Callable, *args, tag: str = "default") -> ScheduledAction:
+        """Run ``callback(*args)`` once ``delay`` seconds from now and return its handle"""
+        deadline = time.perf_counter_ns() + int(max(delay, 0.0) * 1e9)
+        action = ScheduledAction(deadline, callback, args, tag)
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), action))
+            self._ensure_thread()
+            self._cond.notify()
+        return action
+
+    def reschedule(self, action: ScheduledAction, delay: float) -> bool:
+        """Move a pending action to ``delay`` seconds from now; False if it already ran"""
+        with self._cond:
+            if not action.pending:
+                return False
+            action.deadline = time.perf_counter_ns() + int(max(delay, 0.0) * 1e9)
+            heapq.heappush(self._heap, (action.deadline, next(self._seq), action))
+            self._cond.notify()
+        return True
+
+    def cancel(self, action: ScheduledAction) -> bool:
+        """Cancel a pending action; False if it already ran or was cancelled"""
+        with self._cond:
+            if action is None or not action.pending:
+                return False
+            action.cancelled = True
+            self._cond.notify()
+        return True
+
+    def _next_due(self):
+        """Return the next action within the spin window, waiting as needed; None once stopped"""
+        with self._cond:
+            while self._running:
+                heap = self._heap
+                # Entries for cancelled or rescheduled actions are dropped lazily
+                while heap and (not heap[0][2].pending or heap[0][0] != heap[0][2].deadline):
+                    heapq.heappop(heap)
+                if not heap:
+                    self._cond.wait()
+                    continue
+                remaining = heap[0][0] - time.perf_counter_ns()
+                if remaining <= TIMER_SPIN_NS:
+                    return heap[0][2]
+                self._cond.wait((remaining - TIMER_SPIN_NS) / 1e9)
+            return None
+
+    def _claim(self, action, deadline):
+        """Mark ``action`` fired if it is still due at ``deadline``"""
+        with self._cond:
+            if not action.pending or action.deadline != deadline:
+                return False
+            action.fired = True
+            return True
+
+    def _run(self):
+        with high_resolution_timers():
+            while True:
+                action = self._next_due()
+                if action is None:
+                    return
+                deadline = action.deadline
+                while time.perf_counter_ns() < deadline:
+                    time.sleep(0)
+                if not self._claim(action, deadline):
+                    continue
+                self._record(action.tag, time.perf_counter_ns() - deadline)
                 try:
-                    self.release(key)
+                    action.callback(*action.args)
                 except Exception:
                     pass
-        mouse_controller.release_all()
 
-key_manager = AXISKeyManager()
+    def _record(self, tag, lateness_ns):
+        stats = self._jitter.get(tag)
+        if stats is None:
+            stats = self._jitter.setdefault(tag, JitterStats())
+        stats.record(lateness_ns)
+
+    def jitter_report(self):
+        """Return {tag: {count, p50_us, p99_us, max_us}} for every tag that has fired"""
+        return {tag: stats.percentiles() for tag, stats in list(self._jitter.items())}
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            for _, _, action in self._heap:
+                action.cancelled = True
+            self._heap.clear()
+            self._cond.notify_all()
+
+
+@contextlib.contextmanager
+def high_resolution_timers():
+    """Request 1 ms system timer resolution on Windows for the duration of the block"""
+    winmm = None
+    try:
+        winmm = ctypes.windll.winmm
+        winmm.timeBeginPeriod(1)
+    except Exception:
+        winmm = None
+    try:
+        yield
+    finally:
+        if winmm is not None:
+            try:
+                winmm.timeEndPeriod(1)
+            except Exception:
+                pass
+
+_timer_scheduler = None
+
+def get_timer_scheduler():
+    """Return the shared timer scheduler, creating it on first use"""
+    global _timer_scheduler
+    if _timer_scheduler is None:
+        with _subsystem_lock:
+            if _timer_scheduler is None:
+                _timer_scheduler = TimerScheduler()
+    return _timer_scheduler
 
 
 # ---------------------------
-# Mouse Listener
+# Task Supervisor
 # ---------------------------
-class AXISMouseListener:
-    def __init__(self, button_name: str, on_press: Callable, on_release: Callable):
-        self.button_name = button_name
-        self.on_press_callback = on_press
-        self.on_release_callback = on_release
-        self.listener = None
-        self.running = False
+SUPERVISOR_MAX_TASKS = 4      # background tasks allowed at once
+SUPERVISOR_BACKOFF_S = 1.0    # first restart delay after a crash, doubled per consecutive crash
+SUPERVISOR_BACKOFF_MAX_S = 60.0
+SHUTDOWN_DEADLINE_S = 2.0     # total time shutdown() may take
+UI_POLL_MS = 50               # how often the Tk thread drains queued UI calls
+
+
+def release_held_keys():
+    """Release every key and button the engine is holding down"""
+    for subsystem in (_key_manager, _mouse_controller):
+        if subsystem is not None:
+            try:
+                subsystem.release_all()
+            except Exception:
+                pass
+
+
+class SupervisedTask:
+    def __init__(self, name: str, target: Callable, restart: bool):
+        self.name = name
+        self.target = target
+        self.restart = restart
         self.thread = None
-        self.is_pressed = False
-        self.press_lock = threading.Lock()
-        
-    def start(self):
-        if self.running:
-            return
-        
-        self.running = True
-        self.is_pressed = False
-        self.thread = threading.Thread(target=self._listen, daemon=True)
-        self.thread.start()
-    
-    def _listen(self):
-        try:
-            if not mouse_controller.pynput_available:
+        self.restarts = 0
+        self.last_error = None
+
+
+class TaskSupervisor:
+    """Owns every background task of the client
+
+    Tasks are ``target(stop_event)`` callables that return once the event is
+    set. At most ``max_tasks`` run at a time; crashed tasks are restarted
+    with exponential backoff. Background code reaches Tk only through
+    ``call_ui``, which queues the call for the Tk thread.
+    """
+    def __init__(self, max_tasks: int = SUPERVISOR_MAX_TASKS):
+        self.max_tasks = max_tasks
+        self.stop_event = threading.Event()
+        self._tasks = {}
+        self._lock = threading.Lock()
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_root = None
+        self._ui_thread = None
+
+    def spawn(self, name: str, target: Callable, restart: bool = True) -> SupervisedTask:
+        """Start ``target(stop_event)`` on a supervised thread"""
+        with self._lock:
+            if self.stop_event.is_set():
+                raise RuntimeError("supervisor is shut down")
+            task = self._tasks.get(name)
+            if task is not None and task.thread is not None and task.thread.is_alive():
+                return task
+            running = sum(1 for t in self._tasks.values() if t.thread is not None and t.thread.is_alive())
+            if running >= self.max_tasks:
+                raise RuntimeError(f"too many background tasks (limit {self.max_tasks})")
+            task = SupervisedTask(name, target, restart)
+            task.thread = threading.Thread(target=self._run, args=(task,), name=f"axis-{name}", daemon=True)
+            self._tasks[name] = task
+            task.thread.start()
+            return task
+
+    def _run(self, task: SupervisedTask):
+        failures = 0
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            try:
+                task.target(self.stop_event)
                 return
-            
-            from pynput.mouse import Listener
-            button = mouse_controller.get_button(self.button_name)
-            
-            if not button:
+            except Exception as e:
+                task.last_error = repr(e)
+                print(f"Task {task.name} crashed: {e}")
+            if not task.restart:
                 return
-            
-            def on_click(x, y, btn, pressed):
-                if not self.running:
-                    return False
-
-                try:
-                    btn_str = str(btn).lower() if btn is not None else ''
-                    button_str = str(button).lower() if button is not None else ''
-                except Exception:
-                    btn_str = ''
-                    button_str = ''
+            if time.monotonic() - started > SUPERVISOR_BACKOFF_MAX_S:
+                failures = 0
+            failures += 1
+            delay = min(SUPERVISOR_BACKOFF_S * 2 ** (failures - 1), SUPERVISOR_BACKOFF_MAX_S)
+            if self.stop_event.wait(delay):
+                return
+            task.restarts += 1
+
+    def status(self) -> dict:
+        with self._lock:
+            return {name: {"alive": task.thread is not None and task.thread.is_alive(),
+                           "restarts": task.restarts, "last_error": task.last_error}
+                    for name, task in self._tasks.items()}
+
+    def attach_ui(self, root):
+        """Deliver queued UI calls on ``root``'s thread (the caller's thread)"""
+        self._ui_root = root
+        self._ui_thread = threading.get_ident()
+        self._drain_ui(root)
+
+    def call_ui(self, func: Callable, *args):
+        """Run ``func(*args)`` on the Tk thread; runs inline when already on it"""
+        if threading.get_ident() == self._ui_thread:
+            func(*args)
+        else:
+            self._ui_queue.put((func, args))
 
-                matched = False
-                try:
-                    if btn == button:
-                        matched = True
-                    elif btn_str == button_str:
-                        matched = True
-                    else:
-                        for key in ('left', 'right', 'middle', 'x1', 'x2', 'x_button1', 'x_button2', 'mouse4', 'mouse5'):
-                            if key in btn_str and key in button_str:
-                                matched = True
-                                break
-                except Exception:
-                    matched = False
-
-                if matched:
-                    with self.press_lock:
-                        try:
-                            if pressed and not self.is_pressed:
-                                self.is_pressed = True
-                                self.on_press_callback()
-                            elif not pressed and self.is_pressed:
-                                self.is_pressed = False
-                                self.on_release_callback()
-                        except Exception:
-                            pass
-            
-            with Listener(on_click=on_click) as listener:
-                self.listener = listener
-                listener.join()
-        except Exception:
-            pass
-    
-    def stop(self):
-        self.running = False
-        self.is_pressed = False
-        if self.listener:
+    def _drain_ui(self, root):
+        if root is not self._ui_root:
+            return
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
             try:
-                self.listener.stop()
+                func(*args)
             except Exception:
                 pass
+        try:
+            root.after(UI_POLL_MS, self._drain_ui, root)
+        except Exception:
+            pass  # root destroyed
+
+    def shutdown(self, deadline: float = SHUTDOWN_DEADLINE_S) -> list:
+        """Release held keys, stop the input engine and join tasks within ``deadline`` seconds
+
+        Returns the names of tasks still running when the deadline passed;
+        they are daemon threads and do not keep the process alive.
+        """
+        end = time.monotonic() + deadline
+        self.stop_event.set()
+        release_held_keys()
+        if _input_hooks is not None:
+            _input_hooks.stop()
+        if _timer_scheduler is not None:
+            _timer_scheduler.stop()
+        release_held_keys()  # anything a hook or timer pressed while they were stopping
+
+        with self._lock:
+            tasks = list(self._tasks.values())
+        current = threading.current_thread()
+        for task in tasks:
+            if task.thread is not None and task.thread is not current:
+                task.thread.join(max(end - time.monotonic(), 0))
+        return [task.name for task in tasks if task.thread is not None and task.thread.is_alive()]
+
+_supervisor = None
+
+def get_supervisor():
+    """Return the shared task supervisor, creating it on first use"""
+    global _supervisor
+    if _supervisor is None:
+        with _subsystem_lock:
+            if _supervisor is None:
+                _supervisor = TaskSupervisor()
+    return _supervisor
 
 
 # ---------------------------
@@ -512,6 +1601,7 @@ class LicenseManager:
         self.license_file = os.path.join(self.base_dir, "license.dat")
         self._cached_hwid = None
     
+    @TRACER.traced("hwid.mac")
     def _get_mac(self):
         try:
             node = uuid.getnode()
@@ -521,12 +1611,14 @@ class LicenseManager:
         except Exception:
             return None
 
+    @TRACER.traced("hwid.hostname")
     def _get_hostname(self):
         try:
             return socket.gethostname()
         except Exception:
             return None
 
+    @TRACER.traced("hwid.platform")
     def _get_platform_info(self):
         try:
             u = platform.uname()
@@ -535,6 +1627,7 @@ class LicenseManager:
         except Exception:
             return None
 
+    @TRACER.traced("hwid.disk_serial")
     def _get_disk_serial(self):
         try:
             system = platform.system().lower()
@@ -563,6 +1656,7 @@ class LicenseManager:
         except Exception:
             return None
 
+    @TRACER.traced("get_hwid")
     def get_hwid(self):
         if self._cached_hwid:
             return self._cached_hwid
@@ -599,6 +1693,7 @@ class LicenseManager:
         checksum = hashlib.sha256(encoded.encode()).hexdigest()[:16]
         return f"{encoded}.{checksum}"
 
+    @TRACER.traced("license.decode")
     def _decode_license(self, license_data):
         try:
             if not license_data or '.' not in license_data:
@@ -638,6 +1733,7 @@ class LicenseManager:
         except Exception:
             return False
 
+    @TRACER.traced("license.load")
     def load_license(self):
         try:
             if not os.path.exists(self.license_file):
@@ -653,6 +1749,31 @@ class LicenseManager:
         except Exception:
             return None
 
+    def get_expiry(self):
+        """Return the earliest known expiry (license file or key record) as an aware datetime"""
+        license_info = self.load_license()
+        if not license_info:
+            return None
+
+        candidates = [license_info.get('expires')]
+        record = _load_keys().get(license_info.get('key'))
+        if isinstance(record, dict):
+            candidates.append(record.get('expires'))
+
+        earliest = None
+        for expires in candidates:
+            if not expires:
+                continue
+            try:
+                exp_dt = datetime.fromisoformat(expires)
+                if exp_dt.tzinfo is None:
+                    exp_dt = exp_dt.replace(tzinfo=timezone.utc)
+            except Exception:
+                continue
+            if earliest is None or exp_dt < earliest:
+                earliest = exp_dt
+        return earliest
+
     def delete_license(self):
         try:
             if os.path.exists(self.license_file):
@@ -660,37 +1781,38 @@ class LicenseManager:
         except Exception:
             pass
 
+    @TRACER.traced("check_key_authority")
     def _check_key_authority(self, key, hwid):
-        keys = _load_keys()
-
-        if key not in keys:
-            return False, "Invalid license key"
-
-        record = keys[key]
-
-        if record.get("revoked"):
-            return False, "License key has been revoked"
+        # read-only check against the lock-free snapshot; the key store lock is
+        # only taken when an unbound key has to be bound to this machine
+        record = _load_keys().get(key)
+        problem = _key_record_problem(record, hwid)
+        if problem:
+            return False, problem
+        if record.get("hwid") is None:
+            return self._bind_hwid(key, hwid)
+        return True, "OK"
 
-        expires = record.get("expires")
-        if not expires:
-            return False, "Key has no expiry"
+    def _bind_hwid(self, key, hwid):
+        """Bind an unbound key to this machine
 
+        Binding is a read-modify-write of keys.json, so it re-loads and re-checks
+        under the key store lock; a concurrent keygen write or binding is not
+        overwritten. If the lock cannot be taken the key stays valid and the
+        binding is retried on the next check.
+        """
         try:
-            exp_dt = datetime.fromisoformat(expires)
-            if exp_dt.tzinfo is None:
-                exp_dt = exp_dt.replace(tzinfo=timezone.utc)
-            if datetime.now(timezone.utc) >= exp_dt:
-                return False, "License key expired"
-        except Exception:
-            return False, "Invalid key expiration"
-
-        stored_hwid = record.get("hwid")
-        if stored_hwid is None:
-            record["hwid"] = hwid
-            _save_keys(keys)
-        elif stored_hwid != hwid:
-            return False, "License key already used on another PC"
-
+            with file_lock(KEY_DB_FILE):
+                keys = _load_keys()
+                record = keys.get(key)
+                problem = _key_record_problem(record, hwid)
+                if problem:
+                    return False, problem
+                if record.get("hwid") is None:
+                    record["hwid"] = hwid
+                    _save_keys(keys)
+        except OSError as e:
+            print(f"DEBUG: Could not bind HWID, will retry on the next check: {e}")
         return True, "OK"
 
     def validate_license_key(self, license_data_str):
@@ -745,6 +1867,7 @@ class LicenseManager:
             print(f"DEBUG: Exception in validate_license_key: {e}")
             return False, f"Validation error: {str(e)}"
 
+    @TRACER.traced("is_license_valid")
     def is_license_valid(self):
         try:
             # Try to sync, but don't fail if it doesn't work
@@ -796,6 +1919,35 @@ class LicenseManager:
             return False
 
 
+def watch_license(stop: threading.Event, on_invalid: Callable):
+    """Supervisor task: call ``on_invalid()`` once the license expires or fails remote revalidation
+
+    Sleeps until the expiry or the next revalidation, whichever comes first.
+    """
+    license_mgr = LicenseManager()
+    next_remote_check = time.monotonic() + LICENSE_REVALIDATE_INTERVAL
+    while True:
+        expiry = license_mgr.get_expiry()
+        timeout = next_remote_check - time.monotonic()
+        if expiry is not None:
+            remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+            timeout = min(timeout, remaining)
+
+        if stop.wait(max(timeout, 0)):
+            return
+
+        if expiry is not None and datetime.now(timezone.utc) >= expiry:
+            license_mgr.delete_license()
+            on_invalid()
+            return
+
+        if time.monotonic() >= next_remote_check:
+            next_remote_check = time.monotonic() + LICENSE_REVALIDATE_INTERVAL
+            if not license_mgr.is_license_valid():
+                on_invalid()
+                return
+
+
 # ---------------------------
 # ACTIVATION WINDOW
 # ---------------------------
@@ -905,14 +2057,382 @@ class ActivationWindow:
             self.status_label.config(text="✗ " + message, fg="#ff5555")
 
 
+# ---------------------------
+# Macro Engine
+# ---------------------------
+MACRO_DRAG_SELECT = "drag_select"
+MACRO_DOUBLE_EDIT = "double_edit"
+MACROS = (MACRO_DRAG_SELECT, MACRO_DOUBLE_EDIT)
+MACRO_KEY_FIELDS = {
+    MACRO_DRAG_SELECT: ("drag_key", "select_key"),
+    MACRO_DOUBLE_EDIT: ("double_edit_key", "double_edit_drag", "double_edit_select"),
+}
+DEFAULT_DOUBLE_EDIT_DELAY = 6.0
+
+STATUS_IDLE = "idle"
+STATUS_ACTIVE = "active"
+STATUS_WAITING = "waiting"   # running, but the trigger key does not resolve yet
+STATUS_MISSING = "missing"   # start refused because a key field is empty
+
+
+def normalize_key_name(key) -> str:
+    return key.lower().strip() if isinstance(key, str) else ""
+
+
+def compile_macro_keys(values: dict):
+    """Return the normalized key fields of a settings dict as an immutable mapping"""
+    return MappingProxyType({field: normalize_key_name(values.get(field))
+                             for fields in MACRO_KEY_FIELDS.values() for field in fields})
+
+
+class MacroEngine:
+    """Drag select and double edit macros driven by a plain settings dict
+
+    Has no UI dependency, so the Tk window and headless mode share it.
+    Every settings change that touches a key field recompiles the bindings
+    and swaps them into the input hook in one step; hook callbacks only
+    ever read ``self.keys``, which is replaced, never mutated.
+    """
+    def __init__(self, on_status: Callable = None):
+        self.on_status = on_status
+        self.values = {}
+        self.keys = compile_macro_keys({})
+        self.active = dict.fromkeys(MACROS, False)
+        self.listeners = dict.fromkeys(MACROS)
+        self.handlers = {
+            MACRO_DRAG_SELECT: (self.on_drag_press, self.on_drag_release),
+            MACRO_DOUBLE_EDIT: (self.on_double_edit_press, self.on_double_edit_release),
+        }
+        self.lock = threading.Lock()
+        self.double_edit_retrigger = DOUBLE_EDIT_RETRIGGER
+        self.double_edit_pending = None
+
+    def apply(self, values: dict):
+        """Take a new settings dict; running macros are rebound only if a key changed"""
+        self.values = dict(values)
+        if dict(compile_macro_keys(self.values)) != dict(self.keys):
+            self.swap()
+
+    def start(self, macro: str) -> bool:
+        keys = compile_macro_keys(self.values)
+        if not all(keys[field] for field in MACRO_KEY_FIELDS[macro]):
+            self._report(macro, STATUS_MISSING)
+            return False
+        if not self.active[macro]:
+            self.active[macro] = True
+            self.swap()
+        return True
+
+    def stop(self, macro: str):
+        self.active[macro] = False
+        self.swap()
+
+    def stop_all(self):
+        for macro in MACROS:
+            self.active[macro] = False
+        self.swap()
+
+    def double_edit_delay(self) -> float:
+        try:
+            return float(self.values.get("double_edit_delay", DEFAULT_DOUBLE_EDIT_DELAY))
+        except (TypeError, ValueError):
+            return DEFAULT_DOUBLE_EDIT_DELAY
+
+    def swap(self):
+        """Compile the active macros' triggers and exchange all bindings at once
+
+        The old and new bindings are swapped with a single dispatch table
+        replacement, so the hooks keep running and no event sees a mix of
+        both. Keys held by the old bindings are released first so nothing
+        stays stuck across the switch.
+        """
+        with self.lock:
+            old_keys = self.keys
+            pending, self.double_edit_pending = self.double_edit_pending, None
+            if pending is not None and get_timer_scheduler().cancel(pending):
+                self.finish_double_edit(old_keys)
+            drag = self.listeners[MACRO_DRAG_SELECT]
+            if drag is not None and drag.is_pressed and old_keys["select_key"]:
+                get_key_manager().release(old_keys["select_key"])
+            old = [listener for listener in self.listeners.values() if listener is not None]
+            for listener in old:
+                listener.running = False
+
+            self.keys = keys = compile_macro_keys(self.values)
+            compiled = []
+            for macro in MACROS:
+                listener = None
+                if self.active[macro]:
+                    trigger = keys[MACRO_KEY_FIELDS[macro][0]]
+                    listener = create_trigger_listener(trigger, *self.handlers[macro])
+                    binding = listener.prepare()
+                    if binding is not None:
+                        compiled.append((listener, binding))
+                self.listeners[macro] = listener
+
+            tokens = get_input_hooks().replace([listener.token for listener in old],
+                                               [binding for _, binding in compiled])
+            for listener in old:
+                listener.token = None
+            for (listener, _), token in zip(compiled, tokens):
+                listener.activate(token)
+
+            statuses = {}
+            for macro in MACROS:
+                listener = self.listeners[macro]
+                if not self.active[macro]:
+                    statuses[macro] = STATUS_IDLE
+                elif listener is not None and listener.running:
+                    statuses[macro] = STATUS_ACTIVE
+                else:
+                    statuses[macro] = STATUS_WAITING
+        for macro, status in statuses.items():
+            self._report(macro, status)
+
+    def _report(self, macro, status):
+        if self.on_status is not None:
+            try:
+                self.on_status(macro, status)
+            except Exception:
+                pass
+
+    def on_drag_press(self):
+        """Hold the select key while the drag trigger is down"""
+        select = self.keys["select_key"]
+        if select:
+            get_key_manager().press(select)
+
+    def on_drag_release(self):
+        select = self.keys["select_key"]
+        if select:
+            get_key_manager().release(select)
+
+    def on_double_edit_press(self):
+        pass
+
+    def on_double_edit_release(self):
+        """Press the drag/select keys and schedule their release without blocking the hook"""
+        delay = self.double_edit_delay()
+        scheduler = get_timer_scheduler()
+        # same lock as swap(), which cancels and replaces the pending release from the Tk thread
+        with self.lock:
+            keys = self.keys
+            if not (keys["double_edit_drag"] and keys["double_edit_select"]):
+                return
+            pending = self.double_edit_pending
+            if pending is not None and pending.pending:
+                if self.double_edit_retrigger == "ignore":
+                    return
+                if self.double_edit_retrigger == "extend" and scheduler.reschedule(pending, delay):
+                    return
+                if scheduler.cancel(pending):
+                    self.finish_double_edit(keys)
+
+            get_key_manager().press_many((keys["double_edit_drag"], keys["double_edit_select"]))
+            self.double_edit_pending = scheduler.schedule(delay, self.finish_double_edit, keys, tag="double_edit")
+
+    def finish_double_edit(self, keys):
+        """Release the keys held by a double-edit trigger"""
+        try:
+            get_key_manager().release_many((keys["double_edit_select"], keys["double_edit_drag"]))
+        except Exception:
+            pass
+
+
+# ---------------------------
+# Config Store
+# ---------------------------
+MACRO_SETTINGS_FILE = os.path.join(application_path, "macro_settings.json")
+
+
+class ConfigStore:
+    """Settings backed by Tk variables that push every change to subscribers
+
+    Changes arrive through Tk variable write traces, so subscribers run on
+    the Tk thread as soon as a value changes. The last value of every field
+    is cached for threads that must not touch Tk (hook and timer callbacks).
+    """
+    def __init__(self, root, variables: dict):
+        self.root = root
+        self.variables = variables
+        self._values = {}
+        self._subscribers = []
+        self._persist = None
+        self._save_job = None
+        for name, var in variables.items():
+            try:
+                self._values[name] = var.get()
+            except Exception:
+                self._values[name] = None
+            var.trace_add("write", lambda *_, name=name: self._on_write(name))
+
+    def get(self, name, default=None):
+        value = self._values.get(name)
+        return default if value is None else value
+
+    def snapshot(self) -> dict:
+        return dict(self._values)
+
+    def subscribe(self, callback: Callable, fields=None):
+        """Call ``callback(name, value)`` whenever one of ``fields`` (default: any) changes"""
+        self._subscribers.append((frozenset(fields) if fields else None, callback))
+
+    def update(self, values: dict):
+        """Set several fields; subscribers fire through the variable traces"""
+        for name, value in values.items():
+            var = self.variables.get(name)
+            if var is None or value is None:
+                continue
+            try:
+                var.set(value)
+            except Exception:
+                pass
+
+    def _on_write(self, name):
+        try:
+            value = self.variables[name].get()
+        except Exception:
+            return  # e.g. a numeric variable holding a half-typed value
+        if value == self._values.get(name):
+            return
+        self._values[name] = value
+        for fields, callback in list(self._subscribers):
+            if fields is None or name in fields:
+                try:
+                    callback(name, value)
+                except Exception:
+                    pass
+
+    def persist(self, callback: Callable, delay_ms: int = 500):
+        """Call ``callback(snapshot)`` after changes settle for ``delay_ms``"""
+        self._persist = callback
+        self.subscribe(lambda name, value: self._schedule_save(delay_ms))
+
+    def _schedule_save(self, delay_ms):
+        if self._save_job is not None:
+            try:
+                self.root.after_cancel(self._save_job)
+            except Exception:
+                pass
+        self._save_job = self.root.after(delay_ms, self.flush)
+
+    def flush(self):
+        if self._save_job is not None:
+            try:
+                self.root.after_cancel(self._save_job)
+            except Exception:
+                pass
+        self._save_job = None
+        if self._persist is not None:
+            try:
+                self._persist(self.snapshot())
+            except Exception:
+                pass
+
+
+# ---------------------------
+# Profiles
+# ---------------------------
+MACRO_PROFILES_FILE = os.path.join(application_path, "macro_profiles.json")
+DEFAULT_PROFILE = "Default"
+# every profile field; older or partial profiles get these for what they lack
+PROFILE_DEFAULTS = MappingProxyType({
+    **{field: "" for fields in MACRO_KEY_FIELDS.values() for field in fields},
+    "double_edit_delay": DEFAULT_DOUBLE_EDIT_DELAY,
+})
+
+
+class ProfileStore:
+    """Named macro settings profiles persisted in one JSON file
+
+    The file holds ``{"active": name, "profiles": {name: settings}}``. A
+    missing file is seeded from the single-profile ``macro_settings.json``
+    written by earlier versions.
+    """
+    def __init__(self, path: str = MACRO_PROFILES_FILE, legacy_path: str = MACRO_SETTINGS_FILE):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.profiles = {}
+        self.active = DEFAULT_PROFILE
+        self._lock = threading.Lock()
+
+    def load(self):
+        data = None
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except Exception:
+            pass
+        if isinstance(data, dict) and isinstance(data.get("profiles"), dict):
+            self.profiles = {name: dict(values) for name, values in data["profiles"].items()
+                             if isinstance(values, dict)}
+            self.active = data.get("active") or DEFAULT_PROFILE
+        else:
+            legacy = {}
+            try:
+                with open(self.legacy_path, "r") as f:
+                    legacy = json.load(f)
+            except Exception:
+                pass
+            self.profiles = {DEFAULT_PROFILE: legacy if isinstance(legacy, dict) else {}}
+            self.active = DEFAULT_PROFILE
+        if self.active not in self.profiles:
+            self.profiles[self.active] = {}
+        return self
+
+    def names(self):
+        return sorted(self.profiles, key=str.lower)
+
+    def get(self, name: str):
+        """Complete settings of profile ``name``, missing fields filled from PROFILE_DEFAULTS"""
+        values = self.profiles.get(name)
+        if values is None:
+            return None
+        return {**PROFILE_DEFAULTS, **{field: value for field, value in values.items() if value is not None}}
+
+    def put(self, name: str, values: dict):
+        with self._lock:
+            self.profiles[name] = dict(values)
+
+    def delete(self, name: str) -> bool:
+        """Remove ``name`` unless it is the last remaining profile"""
+        with self._lock:
+            if name not in self.profiles or len(self.profiles) <= 1:
+                return False
+            del self.profiles[name]
+            if self.active == name:
+                self.active = self.names()[0]
+            return True
+
+    def save(self):
+        with self._lock:
+            try:
+                atomic_write_json(self.path, {"active": self.active, "profiles": self.profiles})
+            except Exception:
+                pass
+
+    def persist_active(self, values: dict):
+        """Store ``values`` as the active profile and write the file"""
+        self.put(self.active, values)
+        self.save()
+
+
 # ---------------------------
 # MAIN GUI
 # ---------------------------
+MACRO_STATUS_TEXT = {
+    STATUS_IDLE: ("Status: Idle", "#888888"),
+    STATUS_ACTIVE: ("Status: Active", "#00ff88"),
+    STATUS_WAITING: ("Status: Waiting for a valid trigger key", "#ffaa00"),
+    STATUS_MISSING: ("Status: Missing keys", "#ff5555"),
+}
+
+
 class MacroGUI:
-    def __init__(self, root):
+    def __init__(self, root, profiles: ProfileStore = None):
         self.root = root
         self.root.title("AXIS SERVICES - Macro Controller")
-        self.root.geometry("700x650")
+        self.root.geometry("700x700")
         self.root.configure(bg="#0a0a0a")
         self.root.resizable(False, False)
         
@@ -922,27 +2442,17 @@ class MacroGUI:
         self.double_edit_select_var = tk.StringVar()
         self.double_edit_key_var = tk.StringVar()
         self.double_edit_delay_var = tk.DoubleVar(value=6.0)
+        self.latency_var = tk.BooleanVar(value=LATENCY.enabled)
+
+        self.profiles = profiles or ProfileStore().load()
+        self.profile_var = tk.StringVar(value=self.profiles.active)
+        self.profile_name_var = tk.StringVar()
+        self.profile_menu = None
+        self.applying_profile = False
 
-        self.drag_key = ""
-        self.select_key = ""
-        self.drag_active = False
-        self.drag_thread = None
-        self.drag_stop_event = threading.Event()
-        self.drag_lock = threading.Lock()
-        self.drag_listener = None
-
-        self.double_edit_active = False
-        self.double_edit_thread = None
-        self.double_edit_stop_event = threading.Event()
-        self.double_edit_listener = None
-        self.double_edit_key = ""
-        self.double_edit_drag = ""
-        self.double_edit_select = ""
-        self.double_edit_lock = threading.Lock()
-
-        self.keyboard_hooks = set()
-        self.last_config = ("", "", "", "", "")
         self.shutting_down = False
+        self.supervisor = get_supervisor()
+        self.engine = MacroEngine(on_status=self.on_engine_status)
 
         self.drag_status_label = None
         self.double_edit_status_label = None
@@ -950,9 +2460,24 @@ class MacroGUI:
 
         self.setup_gui()
 
-        threading.Thread(target=self.config_watcher, daemon=True).start()
-        threading.Thread(target=self.status_updater, daemon=True).start()
-        threading.Thread(target=self.license_checker, daemon=True).start()
+        self.settings = ConfigStore(self.root, {
+            "drag_key": self.drag_key_var,
+            "select_key": self.select_key_var,
+            "double_edit_key": self.double_edit_key_var,
+            "double_edit_drag": self.double_edit_drag_var,
+            "double_edit_select": self.double_edit_select_var,
+            "double_edit_delay": self.double_edit_delay_var,
+        })
+        self.settings.subscribe(self.update_delay_label, ("double_edit_delay",))
+        self.settings.subscribe(self.on_config_change)
+        self.settings.update(self.profiles.get(self.profiles.active))
+        self.engine.apply(self.settings.snapshot())
+        self.settings.persist(self.profiles.persist_active)
+        self.update_delay_label("double_edit_delay", self.settings.get("double_edit_delay", 6.0))
+
+        self.supervisor.attach_ui(self.root)
+        self.supervisor.spawn("license", functools.partial(
+            watch_license, on_invalid=lambda: self.supervisor.call_ui(self.on_closing)))
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -963,7 +2488,22 @@ class MacroGUI:
 
         title = tk.Label(main_frame, text="AXIS SERVICES - Macro Controller", 
                         font=("Arial", 16, "bold"), fg="#9fff5b", bg="#0a0a0a")
-        title.pack(pady=(0, 20))
+        title.pack(pady=(0, 15))
+
+        # Profiles
+        profile_frame = tk.Frame(main_frame, bg="#0a0a0a")
+        profile_frame.pack(fill='x', pady=(0, 15))
+        tk.Label(profile_frame, text="Profile:", fg="#ffffff", bg="#0a0a0a").pack(side='left')
+        self.profile_menu = tk.OptionMenu(profile_frame, self.profile_var, self.profiles.active)
+        self.profile_menu.config(bg="#2a2a2a", fg="#ffffff", highlightthickness=0, width=15)
+        self.profile_menu.pack(side='left', padx=(10, 10))
+        tk.Entry(profile_frame, textvariable=self.profile_name_var, bg="#2a2a2a",
+                fg="#ffffff", width=18).pack(side='left', padx=(0, 5))
+        tk.Button(profile_frame, text="Save As", command=self.save_profile_as,
+                 bg="#2a2a2a", fg="#ffffff", width=10).pack(side='left', padx=(0, 5))
+        tk.Button(profile_frame, text="Delete", command=self.delete_profile,
+                 bg="#2a2a2a", fg="#ffffff", width=10).pack(side='left')
+        self.refresh_profile_menu()
 
         # Drag Select Section
         drag_frame = tk.LabelFrame(main_frame, text="DRAG SELECT", 
@@ -981,9 +2521,9 @@ class MacroGUI:
 
         btn_frame = tk.Frame(drag_frame, bg="#1a1a1a")
         btn_frame.pack(fill='x')
-        tk.Button(btn_frame, text="Start", command=self.bind_drag_select, 
+        tk.Button(btn_frame, text="Start", command=lambda: self.engine.start(MACRO_DRAG_SELECT), 
                  bg="#9fff5b", fg="#000000", width=15).pack(side='left', padx=(0, 5))
-        tk.Button(btn_frame, text="Stop", command=self.stop_drag_select, 
+        tk.Button(btn_frame, text="Stop", command=lambda: self.engine.stop(MACRO_DRAG_SELECT), 
                  bg="#ff5555", fg="#ffffff", width=15).pack(side='left')
 
         self.drag_status_label = tk.Label(drag_frame, text="Status: Idle", 
@@ -1019,205 +2559,183 @@ class MacroGUI:
 
         btn_frame2 = tk.Frame(double_frame, bg="#1a1a1a")
         btn_frame2.pack(fill='x')
-        tk.Button(btn_frame2, text="Start", command=self.bind_double_edit, 
+        tk.Button(btn_frame2, text="Start", command=lambda: self.engine.start(MACRO_DOUBLE_EDIT), 
                  bg="#9fff5b", fg="#000000", width=15).pack(side='left', padx=(0, 5))
-        tk.Button(btn_frame2, text="Stop", command=self.stop_double_edit, 
+        tk.Button(btn_frame2, text="Stop", command=lambda: self.engine.stop(MACRO_DOUBLE_EDIT), 
                  bg="#ff5555", fg="#ffffff", width=15).pack(side='left')
 
         self.double_edit_status_label = tk.Label(double_frame, text="Status: Idle", 
                                                  fg="#888888", bg="#1a1a1a")
         self.double_edit_status_label.pack(anchor='w', pady=(10, 0))
 
-    def status_updater(self):
-        """Update status labels periodically"""
-        while not self.shutting_down:
-            try:
-                if self.delay_val_label:
-                    delay = self.double_edit_delay_var.get()
-                    self.delay_val_label.config(text=f"{delay:.1f}s")
-                time.sleep(0.1)
-            except Exception:
-                pass
-
-    def config_watcher(self):
-        """Watch for configuration changes"""
-        while not self.shutting_down:
-            try:
-                current = (
-                    self.drag_key_var.get(),
-                    self.select_key_var.get(),
-                    self.double_edit_key_var.get(),
-                    self.double_edit_drag_var.get(),
-                    self.double_edit_select_var.get(),
-                )
-                if current != self.last_config:
-                    self.last_config = current
-                time.sleep(0.5)
-            except Exception:
-                pass
-
-    def license_checker(self):
-        """Periodically check license validity"""
-        while not self.shutting_down:
-            try:
-                license_mgr = LicenseManager()
-                if not license_mgr.is_license_valid():
-                    self.on_closing()
-                time.sleep(30)
-            except Exception:
-                pass
-
-    def normalize(self, key: str) -> str:
-        """Normalize key name"""
-        return key.lower().strip() if key else ""
-
-    def is_mouse_button(self, key: str) -> bool:
-        """Check if key is a mouse button"""
-        return key_manager.is_mouse_button(key)
-
-    def bind_drag_select(self):
-        """Bind and start drag select macro"""
-        with self.drag_lock:
-            self.drag_key = self.normalize(self.drag_key_var.get())
-            self.select_key = self.normalize(self.select_key_var.get())
-            
-            if not self.drag_key or not self.select_key:
-                if self.drag_status_label:
-                    self.drag_status_label.config(text="Status: Missing keys", fg="#ff5555")
-                return
-            
-            if self.drag_active:
-                return
-            
-            self.drag_active = True
-            self.drag_stop_event.clear()
-            self.drag_thread = threading.Thread(target=self.drag_select_loop, daemon=True)
-            self.drag_thread.start()
-            if self.drag_status_label:
-                self.drag_status_label.config(text="Status: Active", fg="#00ff88")
-
-    def on_drag_press(self):
-        """Handle drag key press"""
-        if self.drag_active and self.drag_key and self.select_key:
-            try:
-                key_manager.press(self.select_key)
-            except Exception:
-                pass
-
-    def on_drag_release(self):
-        """Handle drag key release"""
-        if self.drag_active and self.select_key:
-            try:
-                key_manager.release(self.select_key)
-            except Exception:
-                pass
+        # Diagnostics
+        diag_frame = tk.Frame(main_frame, bg="#0a0a0a")
+        diag_frame.pack(fill='x')
+        tk.Checkbutton(diag_frame, text="Latency instrumentation", variable=self.latency_var,
+                       command=lambda: LATENCY.set_enabled(self.latency_var.get()),
+                       fg="#888888", bg="#0a0a0a", selectcolor="#1a1a1a",
+                       activebackground="#0a0a0a").pack(side='left')
+        tk.Button(diag_frame, text="Dump latency", command=self.dump_latency,
+                 bg="#2a2a2a", fg="#ffffff", width=15).pack(side='left', padx=(10, 0))
+
+    def dump_latency(self):
+        """Write hook-to-injection latency histograms next to the application"""
+        LATENCY.dump(os.path.join(application_path, "latency_histograms.json"))
+
+    def refresh_profile_menu(self):
+        """Rebuild the profile dropdown from the profile store"""
+        if not self.profile_menu:
+            return
+        menu = self.profile_menu["menu"]
+        menu.delete(0, "end")
+        for name in self.profiles.names():
+            menu.add_command(label=name, command=lambda name=name: self.apply_profile(name))
+        self.profile_var.set(self.profiles.active)
+
+    def save_profile_as(self):
+        """Copy the current settings into a new (or existing) profile and switch to it"""
+        name = self.profile_name_var.get().strip()
+        if not name:
+            return
+        self.settings.flush()
+        self.profiles.put(name, self.settings.snapshot())
+        self.profiles.active = name
+        self.profiles.save()
+        self.profile_name_var.set("")
+        self.refresh_profile_menu()
+
+    def delete_profile(self):
+        """Delete the active profile and switch to the next remaining one"""
+        if self.profiles.delete(self.profiles.active):
+            self.profiles.save()
+            self.apply_profile(self.profiles.active, force=True)
+
+    def apply_profile(self, name: str, force: bool = False):
+        """Load profile ``name`` and hot-swap the running macros onto its keys
+
+        Variable traces are muted while the fields are filled in, so the
+        engine sees the new profile once, as a whole.
+        """
+        values = self.profiles.get(name)
+        if values is None or (name == self.profiles.active and not force):
+            self.refresh_profile_menu()
+            return
+        self.settings.flush()
+        self.profiles.active = name
+        self.applying_profile = True
+        try:
+            self.settings.update(values)
+        finally:
+            self.applying_profile = False
+        self.profiles.save()
+        self.refresh_profile_menu()
+        self.engine.apply(self.settings.snapshot())
+
+    def update_delay_label(self, name, value):
+        """Show the double edit delay next to its slider"""
+        if self.delay_val_label:
+            self.delay_val_label.config(text=f"{value:.1f}s")
+
+    def set_status(self, label, text, fg):
+        if label:
+            label.config(text=text, fg=fg)
+
+    def on_config_change(self, name, value):
+        """Hand every settings edit to the engine; running macros pick it up immediately"""
+        if not self.applying_profile:
+            self.engine.apply(self.settings.snapshot())
+
+    def on_engine_status(self, macro, status):
+        self.supervisor.call_ui(self.show_status, macro, status)
+
+    def show_status(self, macro, status):
+        label = {MACRO_DRAG_SELECT: self.drag_status_label,
+                 MACRO_DOUBLE_EDIT: self.double_edit_status_label}.get(macro)
+        self.set_status(label, *MACRO_STATUS_TEXT.get(status, MACRO_STATUS_TEXT[STATUS_IDLE]))
 
-    def drag_select_loop(self):
-        """Main drag select loop"""
+    def on_closing(self):
+        """Handle window closing; runs on the Tk thread"""
+        if self.shutting_down:
+            return
+        self.shutting_down = True
         try:
-            if self.drag_key and not self.is_mouse_button(self.drag_key):
-                listener = AXISMouseListener(self.drag_key, self.on_drag_press, self.on_drag_release)
-                self.drag_listener = listener
-                listener.start()
-                while self.drag_active and not self.drag_stop_event.is_set():
-                    time.sleep(0.1)
-                listener.stop()
-            else:
-                while self.drag_active and not self.drag_stop_event.is_set():
-                    time.sleep(0.1)
+            self.settings.flush()
         except Exception:
             pass
-
-    def stop_drag_select(self):
-        """Stop drag select macro"""
-        with self.drag_lock:
-            self.drag_active = False
-            self.drag_stop_event.set()
-            if self.drag_listener:
-                try:
-                    self.drag_listener.stop()
-                except Exception:
-                    pass
-            if self.drag_status_label:
-                self.drag_status_label.config(text="Status: Idle", fg="#888888")
-
-    def bind_double_edit(self):
-        """Bind and start double edit macro"""
-        with self.double_edit_lock:
-            self.double_edit_key = self.normalize(self.double_edit_key_var.get())
-            self.double_edit_drag = self.normalize(self.double_edit_drag_var.get())
-            self.double_edit_select = self.normalize(self.double_edit_select_var.get())
-            
-            if not all([self.double_edit_key, self.double_edit_drag, self.double_edit_select]):
-                if self.double_edit_status_label:
-                    self.double_edit_status_label.config(text="Status: Missing keys", fg="#ff5555")
-                return
-            
-            if self.double_edit_active:
-                return
-            
-            self.double_edit_active = True
-            self.double_edit_stop_event.clear()
-            self.double_edit_thread = threading.Thread(target=self.double_edit_loop, daemon=True)
-            self.double_edit_thread.start()
-            if self.double_edit_status_label:
-                self.double_edit_status_label.config(text="Status: Active", fg="#00ff88")
-
-    def on_double_edit_press(self):
-        """Handle double edit key press"""
-        pass
-
-    def on_double_edit_release(self):
-        """Handle double edit key release"""
-        if self.double_edit_active and self.double_edit_drag and self.double_edit_select:
-            try:
-                delay = self.double_edit_delay_var.get()
-                key_manager.press(self.double_edit_drag)
-                key_manager.press(self.double_edit_select)
-                time.sleep(delay)
-                key_manager.release(self.double_edit_select)
-                key_manager.release(self.double_edit_drag)
-            except Exception:
-                pass
-
-    def double_edit_loop(self):
-        """Main double edit loop"""
+        self.engine.stop_all()
+        stragglers = self.supervisor.shutdown()
+        if stragglers:
+            print(f"Shutdown deadline passed with tasks still running: {', '.join(stragglers)}")
+        if _timer_scheduler is not None:
+            for tag, stats in _timer_scheduler.jitter_report().items():
+                print(f"Timing [{tag}]: n={stats['count']} p50={stats['p50_us']:.1f}us "
+                      f"p99={stats['p99_us']:.1f}us max={stats['max_us']:.1f}us")
         try:
-            listener = AXISMouseListener(self.double_edit_key, 
-                                        self.on_double_edit_press, 
-                                        self.on_double_edit_release)
-            self.double_edit_listener = listener
-            listener.start()
-            while self.double_edit_active and not self.double_edit_stop_event.is_set():
-                time.sleep(0.1)
-            listener.stop()
+            self.root.destroy()
         except Exception:
             pass
 
-    def stop_double_edit(self):
-        """Stop double edit macro"""
-        with self.double_edit_lock:
-            self.double_edit_active = False
-            self.double_edit_stop_event.set()
-            if self.double_edit_listener:
-                try:
-                    self.double_edit_listener.stop()
-                except Exception:
-                    pass
-            if self.double_edit_status_label:
-                self.double_edit_status_label.config(text="Status: Idle", fg="#888888")
 
-    def on_closing(self):
-        """Handle window closing"""
-        self.shutting_down = True
-        self.stop_drag_select()
-        self.stop_double_edit()
-        key_manager.release_all()
-        mouse_controller.release_all()
-        try:
-            self.root.destroy()
-        except Exception:
+# ---------------------------
+# Headless Mode
+# ---------------------------
+def _cli_value(flag: str):
+    """Return the value given as ``flag value`` or ``flag=value`` on the command line, or None"""
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg == flag:
+            return args[i + 1] if i + 1 < len(args) else ""
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def headless_requested() -> bool:
+    return "--headless" in sys.argv[1:]
+
+
+def start_headless_engine(profile_name: str = None, profiles: ProfileStore = None) -> MacroEngine:
+    """Build a MacroEngine from a stored profile and start every macro the profile fully configures"""
+    profiles = profiles or ProfileStore().load()
+    name = profile_name or profiles.active
+    values = profiles.get(name)
+    if values is None:
+        raise KeyError(f"Unknown profile {name!r} (available: {', '.join(profiles.names())})")
+    engine = MacroEngine(on_status=lambda macro, status: print(f"{macro}: {status}"))
+    engine.apply(values)
+    for macro in MACROS:
+        if all(engine.keys[field] for field in MACRO_KEY_FIELDS[macro]):
+            engine.start(macro)
+    return engine
+
+
+def run_headless(profile_name: str = None) -> int:
+    """Run the macro engine from a profile without any window; tkinter is never imported"""
+    print("AXIS SERVICES - Macro Engine (headless) Starting...")
+    sync_keys_from_github()
+    if not LicenseManager().is_license_valid():
+        print("No valid license found. Activate once with the GUI before running headless.")
+        return 1
+    try:
+        with TRACER.span("headless_engine"):
+            engine = start_headless_engine(profile_name)
+    except KeyError as e:
+        print(e.args[0])
+        return 2
+
+    supervisor = get_supervisor()
+    invalid = threading.Event()
+    supervisor.spawn("license", functools.partial(watch_license, on_invalid=invalid.set))
+    print("Macro engine running. Press Ctrl+C to stop.")
+    try:
+        while not invalid.wait(0.5):  # short waits keep Ctrl+C responsive on Windows
             pass
+        print("License is no longer valid. Stopping.")
+    except KeyboardInterrupt:
+        pass
+    engine.stop_all()
+    supervisor.shutdown()
+    return 0
 
 
 # ---------------------------
@@ -1233,12 +2751,15 @@ def main():
 
         if license_mgr.is_license_valid():
             print("Valid license found. Starting Macro Controller...")
+            frame_started = time.perf_counter_ns()
             root = tk.Tk()
             MacroGUI(root)
+            TRACER.first_frame(root, frame_started, "MacroGUI")
             root.mainloop()
             return
 
         print("No valid license found. Showing activation window...")
+        frame_started = time.perf_counter_ns()
         activation_root = tk.Tk()
 
         def on_activation_success():
@@ -1251,6 +2772,7 @@ def main():
             root.mainloop()
 
         ActivationWindow(activation_root, on_activation_success)
+        TRACER.first_frame(activation_root, frame_started, "ActivationWindow")
         activation_root.mainloop()
 
     except Exception as e:
@@ -1266,5 +2788,13 @@ def main():
             pass
 
 
+TRACER.add("import", _IMPORT_STARTED_NS, time.perf_counter_ns())
+
+
 if __name__ == "__main__":
+    with TRACER.span("elevation_check"):
+        if not is_admin():
+            run_as_admin()
+    if headless_requested():
+        sys.exit(run_headless(_cli_value("--profile")))
     main()
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""Cross-process safe file writes shared by the client and the key admin
+
+Writers take an advisory lock on ``<path>.lock`` (fcntl on POSIX, msvcrt on
+Windows) and publish through a temp file that is renamed over the target,
+so readers never lock and always see either the old or the new file.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_TIMEOUT = 10.0       # seconds to wait for another process's lock
+LOCK_POLL_INTERVAL = 0.005
+REPLACE_RETRIES = 100     # Windows refuses to replace a file a reader has open; retry briefly
+
+
+class FileLock:
+    """Advisory inter-process lock, re-entrant within one process"""
+    def __init__(self, path: str, timeout: float = LOCK_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            lock_file, self._file = self._file, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                lock_file.close()
+        self._thread_lock.release()
+
+    def _lock_file(self):
+        lock_file = open(self.path, "a+")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                self._file = lock_file
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    raise TimeoutError(f"Timed out waiting for lock {self.path}")
+                time.sleep(LOCK_POLL_INTERVAL)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+def file_lock(path: str) -> FileLock:
+    """Return the process-wide lock guarding writes to ``path``"""
+    lock_path = os.path.abspath(path) + ".lock"
+    with _locks_guard:
+        lock = _locks.get(lock_path)
+        if lock is None:
+            lock = _locks[lock_path] = FileLock(lock_path)
+        return lock
+
+
+def _replace(src: str, dst: str):
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(LOCK_POLL_INTERVAL)
+
+
+def atomic_write_bytes(path: str, data: bytes, lock: FileLock = None):
+    """Replace ``path`` with ``data`` in one rename, holding ``lock`` (default: the path's own lock)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    with lock or file_lock(path):
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            _replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def atomic_write_json(path: str, data, lock: FileLock = None):
+    atomic_write_bytes(path, json.dumps(data, indent=4).encode(), lock)
+
+
+def read_json(path: str, default=None):
+    """Read a JSON file without locking; missing or unreadable files give ``default``"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default